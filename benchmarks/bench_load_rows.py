@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Throughput of load_rows (compiled schemas) vs. the former DictReader path.
+
+The DictReader baseline is timed with both date parsers, so the gain of the
+schema registry and the gain of the parse_dt fast path are reported apart.
+
+    python3 benchmarks/bench_load_rows.py [--rows 200000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strike_dca.io import load_rows  # noqa: E402
+from strike_dca.utils import DATE_FMT, dec, parse_dt  # noqa: E402
+
+
+LEGACY_HEADERS = [
+    "Reference", "Date & Time (UTC)", "Transaction Type", "Amount EUR", "Fee EUR", "Amount BTC",
+    "Fee BTC", "BTC Price", "Cost Basis (EUR)", "Destination", "Description", "Transaction Hash", "Note",
+]
+
+
+def write_legacy(path: Path, n: int) -> None:
+    rng = random.Random(42)
+    start = datetime(2015, 1, 1, 9, 0, 0)
+    with path.open("w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(LEGACY_HEADERS)
+        for i in range(n):
+            dt = (start + timedelta(hours=6 * i)).strftime(DATE_FMT)
+            if i % 10 == 0:
+                w.writerow([f"ref-{i}", dt, "Deposit", "175.00", "", "", "", "", "", "", "", "", ""])
+            else:
+                eur = rng.choice(["25.00", "50.00", "75.00"])
+                price = rng.randint(20000, 90000)
+                amount = f"{float(eur) / price:.8f}"
+                w.writerow([f"ref-{i}", dt, "Purchase", f"-{eur}", "", amount, "", f"{price}.00", eur, "", "", "", ""])
+
+
+def strptime_dt(value: str) -> datetime:
+    return datetime.strptime(value, DATE_FMT)
+
+
+def load_rows_dictreader(path: Path, parse=parse_dt) -> list:
+    """The pre-registry legacy loader, kept here as the baseline."""
+    rows = []
+    with path.open(newline="") as f:
+        for r in csv.DictReader(f):
+            r["dt"] = parse(r["Date & Time (UTC)"])
+            r["amount_fiat"] = dec(r["Amount EUR"])
+            r["fee_fiat"] = dec(r["Fee EUR"])
+            r["amount_btc"] = dec(r["Amount BTC"])
+            r["fee_btc"] = dec(r["Fee BTC"])
+            r["price"] = dec(r["BTC Price"])
+            r["cost_basis"] = dec(r["Cost Basis (EUR)"])
+            r["raw_type"] = r.get("Transaction Type")
+            rows.append(r)
+    return rows
+
+
+def best_of(fn, path: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(path)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "legacy.csv"
+        write_legacy(path, args.rows)
+        loaders = (
+            ("DictReader+strptime", lambda p: load_rows_dictreader(p, parse=strptime_dt)),
+            ("DictReader+parse_dt", load_rows_dictreader),
+            ("schema+parse_dt", load_rows),
+        )
+        for label, fn in loaders:
+            secs = best_of(fn, path, args.repeat)
+            print(f"{label:>19}: {args.rows / secs:>10,.0f} rows/s ({secs:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,2 @@
-__all__ = ["cli", "charts", "analysis", "io", "report", "utils"]
+__all__ = ["cli", "cache", "charts", "analysis", "fx", "i18n", "io", "merge", "report", "rolling", "schemas", "tax", "utils"]
 __version__ = "0.1.0"
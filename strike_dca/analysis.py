@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
-from datetime import date
-from typing import Dict, List, Tuple
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
 
-from .io import infer_cost_basis, is_purchase_type
+from .io import infer_cost_basis, is_purchase_type, row_currencies
 
 
 @dataclass
@@ -14,19 +14,26 @@ class AnalysisResult:
     rows: List[dict]
     purchases_all: List[dict]
     real_purchases: List[dict]
+    real_purchase_count: int
     non_executed: List[dict]
+    non_executed_count: int
     inferred_rows: List[Tuple[dict, Decimal, str]]
+    inferred_count: int
     total_btc: Decimal
-    total_eur: Decimal
+    total_fiat: Decimal
     avg_price: Decimal
     monthly: Dict[str, dict]
     quarterly: Dict[str, dict]
-    fee_eur_total: Decimal
+    fee_fiat_total: Decimal
     fee_btc_total: Decimal
     deposits: List[dict]
+    deposit_count: int
     withdrawals: List[dict]
+    withdrawal_count: int
     sends: List[dict]
+    send_count: int
     send_reversals: List[dict]
+    send_reversal_count: int
     deposit_total: Decimal
     withdrawal_total: Decimal
     send_total_btc: Decimal
@@ -35,10 +42,327 @@ class AnalysisResult:
     multi_purchase_days: int
     max_per_day: int
     non_exec_by_desc: Counter
-    non_exec_amount_eur: Decimal
+    non_exec_amount_fiat: Decimal
     deposit_counts: Counter
     start_date: date | None
     end_date: date | None
+    currency: str = "EUR"
+
+
+def _row_type(row: dict) -> str | None:
+    return row.get("Transaction Type") or row.get("raw_type")
+
+
+def _is_reversal(row: dict) -> bool:
+    return (row.get("Description") or "").strip().lower() == "reversal"
+
+
+def _month_bucket() -> dict:
+    return {"fiat": Decimal("0"), "btc": Decimal("0"), "count": 0, "min_price": None, "max_price": None}
+
+
+def _quarter_bucket() -> dict:
+    return {"fiat": Decimal("0"), "btc": Decimal("0"), "count": 0}
+
+
+def _min(a: Any, b: Any) -> Any:
+    return b if a is None else a if b is None else min(a, b)
+
+
+def _max(a: Any, b: Any) -> Any:
+    return b if a is None else a if b is None else max(a, b)
+
+
+def _dec_or_none(value: str | None) -> Decimal | None:
+    return Decimal(value) if value is not None else None
+
+
+def _str_or_none(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+@dataclass
+class PartialAggregate:
+    """Mergeable summary of one account or time shard.
+
+    Holds only sums, counts, min/max and counters, so partials can be built
+    independently (per account, per year, per process or host), serialized
+    with ``to_dict`` and reduced with the associative, commutative ``merge``.
+    """
+
+    currency: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    purchase_count: int = 0
+    total_btc: Decimal = Decimal("0")
+    total_fiat: Decimal = Decimal("0")
+    inferred_count: int = 0
+    monthly: Dict[str, dict] = field(default_factory=dict)
+    quarterly: Dict[str, dict] = field(default_factory=dict)
+    fee_fiat_total: Decimal = Decimal("0")
+    fee_btc_total: Decimal = Decimal("0")
+    deposit_count: int = 0
+    deposit_total: Decimal = Decimal("0")
+    withdrawal_count: int = 0
+    withdrawal_total: Decimal = Decimal("0")
+    send_count: int = 0
+    send_reversal_count: int = 0
+    send_total_btc: Decimal = Decimal("0")
+    send_total_btc_excl_rev: Decimal = Decimal("0")
+    purchases_per_day: Counter = field(default_factory=Counter)
+    non_exec_count: int = 0
+    non_exec_by_desc: Counter = field(default_factory=Counter)
+    non_exec_amount_fiat: Decimal = Decimal("0")
+    deposit_counts: Counter = field(default_factory=Counter)
+
+    @classmethod
+    def from_rows(cls, rows: List[dict]) -> "PartialAggregate":
+        rows = [r for r in rows if r.get("dt") is not None]
+        currencies = row_currencies(rows)
+        if len(currencies) > 1:
+            raise ValueError(f"Rows mix currencies ({', '.join(sorted(currencies))}); normalize them first")
+
+        agg = cls(currency=currencies.pop() if currencies else None)
+        monthly: Dict[str, dict] = defaultdict(_month_bucket)
+        quarterly: Dict[str, dict] = defaultdict(_quarter_bucket)
+        zero = Decimal("0")
+
+        for r in rows:
+            dt = r["dt"]
+            agg.start = _min(agg.start, dt)
+            agg.end = _max(agg.end, dt)
+            agg.fee_fiat_total += r.get("fee_fiat") or zero
+            agg.fee_btc_total += r.get("fee_btc") or zero
+            kind = _row_type(r)
+
+            if is_purchase_type(r):
+                if r.get("amount_btc") is None:
+                    agg.non_exec_count += 1
+                    agg.non_exec_by_desc[(r.get("Description") or "").strip()] += 1
+                    agg.non_exec_amount_fiat += r.get("amount_fiat") or zero
+                    continue
+
+                cost, source = infer_cost_basis(r)
+                amount_btc = r["amount_btc"]
+                agg.purchase_count += 1
+                agg.total_btc += amount_btc
+                agg.total_fiat += cost
+                if source != "provided":
+                    agg.inferred_count += 1
+                agg.purchases_per_day[dt.date().isoformat()] += 1
+
+                m = monthly[dt.strftime("%Y-%m")]
+                m["fiat"] += cost
+                m["btc"] += amount_btc
+                m["count"] += 1
+                price = r.get("price")
+                if price is not None:
+                    m["min_price"] = _min(m["min_price"], price)
+                    m["max_price"] = _max(m["max_price"], price)
+
+                q = quarterly[f"{dt.year}-Q{(dt.month - 1) // 3 + 1}"]
+                q["fiat"] += cost
+                q["btc"] += amount_btc
+                q["count"] += 1
+            elif kind == "Deposit":
+                agg.deposit_count += 1
+                if r.get("amount_fiat") is not None:
+                    agg.deposit_total += r["amount_fiat"]
+                    agg.deposit_counts[float(r["amount_fiat"])] += 1
+            elif kind == "Withdrawal":
+                agg.withdrawal_count += 1
+                agg.withdrawal_total += r.get("amount_fiat") or zero
+            elif kind == "Send":
+                agg.send_count += 1
+                amount_btc = r.get("amount_btc") or zero
+                agg.send_total_btc += amount_btc
+                if _is_reversal(r):
+                    agg.send_reversal_count += 1
+                else:
+                    agg.send_total_btc_excl_rev += amount_btc
+
+        agg.monthly = dict(monthly)
+        agg.quarterly = dict(quarterly)
+        return agg
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        if self.currency and other.currency and self.currency != other.currency:
+            raise ValueError(f"Cannot merge {self.currency} and {other.currency} aggregates; normalize them first")
+
+        monthly: Dict[str, dict] = {}
+        for key in self.monthly.keys() | other.monthly.keys():
+            a = self.monthly.get(key) or _month_bucket()
+            b = other.monthly.get(key) or _month_bucket()
+            monthly[key] = {
+                "fiat": a["fiat"] + b["fiat"],
+                "btc": a["btc"] + b["btc"],
+                "count": a["count"] + b["count"],
+                "min_price": _min(a["min_price"], b["min_price"]),
+                "max_price": _max(a["max_price"], b["max_price"]),
+            }
+        quarterly: Dict[str, dict] = {}
+        for key in self.quarterly.keys() | other.quarterly.keys():
+            a = self.quarterly.get(key) or _quarter_bucket()
+            b = other.quarterly.get(key) or _quarter_bucket()
+            quarterly[key] = {k: a[k] + b[k] for k in ("fiat", "btc", "count")}
+
+        return PartialAggregate(
+            currency=self.currency or other.currency,
+            start=_min(self.start, other.start),
+            end=_max(self.end, other.end),
+            purchase_count=self.purchase_count + other.purchase_count,
+            total_btc=self.total_btc + other.total_btc,
+            total_fiat=self.total_fiat + other.total_fiat,
+            inferred_count=self.inferred_count + other.inferred_count,
+            monthly=monthly,
+            quarterly=quarterly,
+            fee_fiat_total=self.fee_fiat_total + other.fee_fiat_total,
+            fee_btc_total=self.fee_btc_total + other.fee_btc_total,
+            deposit_count=self.deposit_count + other.deposit_count,
+            deposit_total=self.deposit_total + other.deposit_total,
+            withdrawal_count=self.withdrawal_count + other.withdrawal_count,
+            withdrawal_total=self.withdrawal_total + other.withdrawal_total,
+            send_count=self.send_count + other.send_count,
+            send_reversal_count=self.send_reversal_count + other.send_reversal_count,
+            send_total_btc=self.send_total_btc + other.send_total_btc,
+            send_total_btc_excl_rev=self.send_total_btc_excl_rev + other.send_total_btc_excl_rev,
+            purchases_per_day=self.purchases_per_day + other.purchases_per_day,
+            non_exec_count=self.non_exec_count + other.non_exec_count,
+            non_exec_by_desc=self.non_exec_by_desc + other.non_exec_by_desc,
+            non_exec_amount_fiat=self.non_exec_amount_fiat + other.non_exec_amount_fiat,
+            deposit_counts=self.deposit_counts + other.deposit_counts,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form; Decimals are kept exact as strings."""
+        return {
+            "currency": self.currency,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "purchase_count": self.purchase_count,
+            "total_btc": str(self.total_btc),
+            "total_fiat": str(self.total_fiat),
+            "inferred_count": self.inferred_count,
+            "monthly": {
+                k: {
+                    "fiat": str(v["fiat"]),
+                    "btc": str(v["btc"]),
+                    "count": v["count"],
+                    "min_price": _str_or_none(v["min_price"]),
+                    "max_price": _str_or_none(v["max_price"]),
+                }
+                for k, v in sorted(self.monthly.items())
+            },
+            "quarterly": {
+                k: {"fiat": str(v["fiat"]), "btc": str(v["btc"]), "count": v["count"]}
+                for k, v in sorted(self.quarterly.items())
+            },
+            "fee_fiat_total": str(self.fee_fiat_total),
+            "fee_btc_total": str(self.fee_btc_total),
+            "deposit_count": self.deposit_count,
+            "deposit_total": str(self.deposit_total),
+            "withdrawal_count": self.withdrawal_count,
+            "withdrawal_total": str(self.withdrawal_total),
+            "send_count": self.send_count,
+            "send_reversal_count": self.send_reversal_count,
+            "send_total_btc": str(self.send_total_btc),
+            "send_total_btc_excl_rev": str(self.send_total_btc_excl_rev),
+            "purchases_per_day": dict(sorted(self.purchases_per_day.items())),
+            "non_exec_count": self.non_exec_count,
+            "non_exec_by_desc": dict(self.non_exec_by_desc),
+            "non_exec_amount_fiat": str(self.non_exec_amount_fiat),
+            "deposit_counts": {repr(k): v for k, v in sorted(self.deposit_counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PartialAggregate":
+        return cls(
+            currency=data.get("currency"),
+            start=datetime.fromisoformat(data["start"]) if data.get("start") else None,
+            end=datetime.fromisoformat(data["end"]) if data.get("end") else None,
+            purchase_count=data["purchase_count"],
+            total_btc=Decimal(data["total_btc"]),
+            total_fiat=Decimal(data["total_fiat"]),
+            inferred_count=data["inferred_count"],
+            monthly={
+                k: {
+                    "fiat": Decimal(v["fiat"]),
+                    "btc": Decimal(v["btc"]),
+                    "count": v["count"],
+                    "min_price": _dec_or_none(v["min_price"]),
+                    "max_price": _dec_or_none(v["max_price"]),
+                }
+                for k, v in data["monthly"].items()
+            },
+            quarterly={
+                k: {"fiat": Decimal(v["fiat"]), "btc": Decimal(v["btc"]), "count": v["count"]}
+                for k, v in data["quarterly"].items()
+            },
+            fee_fiat_total=Decimal(data["fee_fiat_total"]),
+            fee_btc_total=Decimal(data["fee_btc_total"]),
+            deposit_count=data["deposit_count"],
+            deposit_total=Decimal(data["deposit_total"]),
+            withdrawal_count=data["withdrawal_count"],
+            withdrawal_total=Decimal(data["withdrawal_total"]),
+            send_count=data["send_count"],
+            send_reversal_count=data["send_reversal_count"],
+            send_total_btc=Decimal(data["send_total_btc"]),
+            send_total_btc_excl_rev=Decimal(data["send_total_btc_excl_rev"]),
+            purchases_per_day=Counter(data["purchases_per_day"]),
+            non_exec_count=data["non_exec_count"],
+            non_exec_by_desc=Counter(data["non_exec_by_desc"]),
+            non_exec_amount_fiat=Decimal(data["non_exec_amount_fiat"]),
+            deposit_counts=Counter({float(k): v for k, v in data["deposit_counts"].items()}),
+        )
+
+    def to_result(self) -> AnalysisResult:
+        """Final values; row lists are empty since partials do not keep rows."""
+        per_day = self.purchases_per_day.values()
+        return AnalysisResult(
+            rows=[],
+            purchases_all=[],
+            real_purchases=[],
+            real_purchase_count=self.purchase_count,
+            non_executed=[],
+            non_executed_count=self.non_exec_count,
+            inferred_rows=[],
+            inferred_count=self.inferred_count,
+            total_btc=self.total_btc,
+            total_fiat=self.total_fiat,
+            avg_price=(self.total_fiat / self.total_btc) if self.total_btc else Decimal("0"),
+            monthly=self.monthly,
+            quarterly=self.quarterly,
+            fee_fiat_total=self.fee_fiat_total,
+            fee_btc_total=self.fee_btc_total,
+            deposits=[],
+            deposit_count=self.deposit_count,
+            withdrawals=[],
+            withdrawal_count=self.withdrawal_count,
+            sends=[],
+            send_count=self.send_count,
+            send_reversals=[],
+            send_reversal_count=self.send_reversal_count,
+            deposit_total=self.deposit_total,
+            withdrawal_total=self.withdrawal_total,
+            send_total_btc=self.send_total_btc,
+            send_total_btc_excl_rev=self.send_total_btc_excl_rev,
+            purchase_days=len(self.purchases_per_day),
+            multi_purchase_days=sum(1 for v in per_day if v > 1),
+            max_per_day=max(per_day) if per_day else 0,
+            non_exec_by_desc=self.non_exec_by_desc,
+            non_exec_amount_fiat=self.non_exec_amount_fiat,
+            deposit_counts=self.deposit_counts,
+            start_date=self.start.date() if self.start else None,
+            end_date=self.end.date() if self.end else None,
+            currency=self.currency or "EUR",
+        )
+
+
+def merge_aggregates(parts: List[PartialAggregate]) -> PartialAggregate:
+    merged = PartialAggregate()
+    for part in parts:
+        merged = merged.merge(part)
+    return merged
 
 
 def analyze(rows: List[dict]) -> AnalysisResult:
@@ -49,105 +373,23 @@ def analyze(rows: List[dict]) -> AnalysisResult:
     real_purchases = [r for r in purchases_all if r.get("amount_btc") is not None]
     non_executed = [r for r in purchases_all if r.get("amount_btc") is None]
 
-    total_btc = Decimal("0")
-    total_eur = Decimal("0")
     inferred_rows: List[Tuple[dict, Decimal, str]] = []
     for r in real_purchases:
         cost, source = infer_cost_basis(r)
-        total_btc += r.get("amount_btc") or Decimal("0")
-        total_eur += cost
         if source != "provided":
             inferred_rows.append((r, cost, source))
 
-    avg_price = (total_eur / total_btc) if total_btc else Decimal("0")
-
-    monthly = defaultdict(lambda: {
-        "eur": Decimal("0"),
-        "btc": Decimal("0"),
-        "count": 0,
-        "min_price": None,
-        "max_price": None,
-    })
-    quarterly = defaultdict(lambda: {"eur": Decimal("0"), "btc": Decimal("0"), "count": 0})
-
-    for r in real_purchases:
-        month_key = r["dt"].strftime("%Y-%m")
-        cost, _ = infer_cost_basis(r)
-        monthly[month_key]["eur"] += cost
-        monthly[month_key]["btc"] += r.get("amount_btc") or Decimal("0")
-        monthly[month_key]["count"] += 1
-
-        q = (r["dt"].month - 1) // 3 + 1
-        q_key = f"{r['dt'].year}-Q{q}"
-        quarterly[q_key]["eur"] += cost
-        quarterly[q_key]["btc"] += r.get("amount_btc") or Decimal("0")
-        quarterly[q_key]["count"] += 1
-
-        price = r.get("price")
-        if price is not None:
-            if monthly[month_key]["min_price"] is None or price < monthly[month_key]["min_price"]:
-                monthly[month_key]["min_price"] = price
-            if monthly[month_key]["max_price"] is None or price > monthly[month_key]["max_price"]:
-                monthly[month_key]["max_price"] = price
-
-    fee_eur_total = sum(((r.get("fee_eur") or Decimal("0")) for r in rows), Decimal("0"))
-    fee_btc_total = sum(((r.get("fee_btc") or Decimal("0")) for r in rows), Decimal("0"))
-
-    deposits = [r for r in rows if (r.get("Transaction Type") or r.get("raw_type")) == "Deposit"]
-    withdrawals = [r for r in rows if (r.get("Transaction Type") or r.get("raw_type")) == "Withdrawal"]
-    sends = [r for r in rows if (r.get("Transaction Type") or r.get("raw_type")) == "Send"]
-    send_reversals = [r for r in sends if (r.get("Description") or "").strip().lower() == "reversal"]
-
-    deposit_total = sum(((r.get("amount_eur") or Decimal("0")) for r in deposits), Decimal("0"))
-    withdrawal_total = sum(((r.get("amount_eur") or Decimal("0")) for r in withdrawals), Decimal("0"))
-    send_total_btc = sum(((r.get("amount_btc") or Decimal("0")) for r in sends), Decimal("0"))
-    send_total_btc_excl_rev = sum(
-        ((r.get("amount_btc") or Decimal("0")) for r in sends if r not in send_reversals),
-        Decimal("0"),
-    )
-
-    by_day = defaultdict(int)
-    for r in real_purchases:
-        by_day[r["dt"].date()] += 1
-    purchase_days = len(by_day)
-    multi_purchase_days = sum(1 for v in by_day.values() if v > 1)
-    max_per_day = max(by_day.values()) if by_day else 0
-
-    non_exec_by_desc = Counter((r.get("Description") or "").strip() for r in non_executed)
-    non_exec_amount_eur = sum(((r.get("amount_eur") or Decimal("0")) for r in non_executed), Decimal("0"))
-
-    deposit_counts = Counter(float(r["amount_eur"]) for r in deposits if r.get("amount_eur") is not None)
-
-    start_date = rows[0]["dt"].date() if rows else None
-    end_date = rows[-1]["dt"].date() if rows else None
+    sends = [r for r in rows if _row_type(r) == "Send"]
 
-    return AnalysisResult(
+    return replace(
+        PartialAggregate.from_rows(rows).to_result(),
         rows=rows,
         purchases_all=purchases_all,
         real_purchases=real_purchases,
         non_executed=non_executed,
         inferred_rows=inferred_rows,
-        total_btc=total_btc,
-        total_eur=total_eur,
-        avg_price=avg_price,
-        monthly=monthly,
-        quarterly=quarterly,
-        fee_eur_total=fee_eur_total,
-        fee_btc_total=fee_btc_total,
-        deposits=deposits,
-        withdrawals=withdrawals,
+        deposits=[r for r in rows if _row_type(r) == "Deposit"],
+        withdrawals=[r for r in rows if _row_type(r) == "Withdrawal"],
         sends=sends,
-        send_reversals=send_reversals,
-        deposit_total=deposit_total,
-        withdrawal_total=withdrawal_total,
-        send_total_btc=send_total_btc,
-        send_total_btc_excl_rev=send_total_btc_excl_rev,
-        purchase_days=purchase_days,
-        multi_purchase_days=multi_purchase_days,
-        max_per_day=max_per_day,
-        non_exec_by_desc=non_exec_by_desc,
-        non_exec_amount_eur=non_exec_amount_eur,
-        deposit_counts=deposit_counts,
-        start_date=start_date,
-        end_date=end_date,
+        send_reversals=[r for r in sends if _is_reversal(r)],
     )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+from . import __version__
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_digest(path: Path | str) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_digest() -> str:
+    """Hash of the package sources, so a code change invalidates every output."""
+    h = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def fingerprint(**inputs: Any) -> str:
+    """Stable hash of a stage's inputs; the tool version and sources are always included."""
+    payload = json.dumps({"version": __version__, "code": source_digest(), **inputs}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """Per-output fingerprints for the artifacts in a Report directory.
+
+    An output is fresh when its recorded fingerprint matches and the file on
+    disk still has the digest it had when it was written.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, str]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8")).get("outputs", {})
+            except (ValueError, AttributeError):
+                self.entries = {}
+
+    def is_fresh(self, output: Path, fp: str) -> bool:
+        entry = self.entries.get(output.name)
+        if not entry or entry.get("fingerprint") != fp or not output.exists():
+            return False
+        return entry.get("digest") == file_digest(output)
+
+    def record(self, output: Path, fp: str) -> None:
+        self.entries[output.name] = {"fingerprint": fp, "digest": file_digest(output)}
+
+    def save(self) -> None:
+        payload = {"version": __version__, "outputs": self.entries}
+        self.path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
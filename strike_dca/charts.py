@@ -4,12 +4,22 @@ import argparse
 from collections import defaultdict
 from decimal import Decimal
 from pathlib import Path
+from typing import List
 
-from .io import infer_cost_basis, is_purchase_type, load_rows
+from .fx import FxTable, default_currency, normalize_rows
+from .i18n import strings
+from .io import Row, infer_cost_basis, is_purchase_type, load_rows
+from .rolling import rolling_windows
 from .utils import month_abbr
 
 
-def generate_charts(input_path: Path | str, output_path: Path | str, lang: str = "en") -> None:
+def generate_charts(
+    rows: List[Row],
+    output_path: Path | str,
+    lang: str = "en",
+    rolling: bool = False,
+) -> None:
+    """Render the chart grid from rows already normalized to one currency."""
     try:
         import matplotlib
         matplotlib.use("Agg")
@@ -19,87 +29,95 @@ def generate_charts(input_path: Path | str, output_path: Path | str, lang: str =
             "matplotlib is required for chart generation. Install via Homebrew: brew install python-matplotlib"
         ) from exc
 
-    input_path = Path(input_path)
     output_path = Path(output_path)
+    t = strings(lang)
 
-    rows = [r for r in load_rows(input_path) if r.get("dt") is not None]
-    rows.sort(key=lambda r: r["dt"])
+    rows = sorted((r for r in rows if r.get("dt") is not None), key=lambda r: r["dt"])
+    cur = default_currency(rows)
 
     purchases = [r for r in rows if is_purchase_type(r) and r.get("amount_btc") is not None]
 
-    monthly = defaultdict(lambda: {"eur": Decimal("0"), "btc": Decimal("0")})
+    monthly = defaultdict(lambda: {"fiat": Decimal("0"), "btc": Decimal("0")})
     for r in purchases:
         m = r["dt"].strftime("%Y-%m")
         cost, _ = infer_cost_basis(r)
-        monthly[m]["eur"] += cost
+        monthly[m]["fiat"] += cost
         monthly[m]["btc"] += r.get("amount_btc") or Decimal("0")
 
     months = sorted(monthly.keys())
     month_labels = [month_abbr(int(m.split("-")[1]), lang=lang) for m in months]
-    eur_vals = [float(monthly[m]["eur"]) for m in months]
+    fiat_vals = [float(monthly[m]["fiat"]) for m in months]
     btc_vals = [float(monthly[m]["btc"]) for m in months]
     avg_price_vals = [
-        float((monthly[m]["eur"] / monthly[m]["btc"]) if monthly[m]["btc"] else Decimal("0"))
+        float((monthly[m]["fiat"] / monthly[m]["btc"]) if monthly[m]["btc"] else Decimal("0"))
         for m in months
     ]
 
-    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
+    fig, axs = plt.subplots(3 if rolling else 2, 2, figsize=(12, 12 if rolling else 8))
 
     ax = axs[0, 0]
     ax.plot(month_labels, avg_price_vals, marker="o", color="blue", linewidth=2)
-    if lang == "de":
-        ax.set_title("Durchschnittlicher Kaufpreis pro Bitcoin (EUR)")
-        ax.set_xlabel("Monat")
-        ax.set_ylabel("Preis (EUR)")
-    else:
-        ax.set_title("Average purchase price per Bitcoin (EUR)")
-        ax.set_xlabel("Month")
-        ax.set_ylabel("Price (EUR)")
+    ax.set_title(t["chart_avg_price"].format(cur=cur))
+    ax.set_xlabel(t["chart_month"])
+    ax.set_ylabel(t["chart_price"].format(cur=cur))
     ax.grid(True, alpha=0.3)
     ax.tick_params(axis="x", rotation=45)
 
     ax = axs[0, 1]
     ax.bar(month_labels, btc_vals, color="#f4a62a")
-    if lang == "de":
-        ax.set_title("Bitcoin gekauft pro Monat")
-        ax.set_xlabel("Monat")
-        ax.set_ylabel("BTC Menge")
-    else:
-        ax.set_title("Bitcoin bought per month")
-        ax.set_xlabel("Month")
-        ax.set_ylabel("BTC amount")
+    ax.set_title(t["chart_btc_bought"])
+    ax.set_xlabel(t["chart_month"])
+    ax.set_ylabel(t["chart_btc_amount"])
     ax.grid(True, axis="y", alpha=0.3)
     ax.tick_params(axis="x", rotation=45)
 
     ax = axs[1, 0]
-    ax.bar(month_labels, eur_vals, color="#1f7a1f")
-    if lang == "de":
-        ax.set_title("EUR ausgegeben pro Monat")
-        ax.set_xlabel("Monat")
-        ax.set_ylabel("EUR Betrag")
-    else:
-        ax.set_title("EUR spent per month")
-        ax.set_xlabel("Month")
-        ax.set_ylabel("EUR amount")
+    ax.bar(month_labels, fiat_vals, color="#1f7a1f")
+    ax.set_title(t["chart_fiat_spent"].format(cur=cur))
+    ax.set_xlabel(t["chart_month"])
+    ax.set_ylabel(t["chart_fiat_amount"].format(cur=cur))
     ax.grid(True, axis="y", alpha=0.3)
     ax.tick_params(axis="x", rotation=45)
 
     ax = axs[1, 1]
     ax.bar(month_labels, btc_vals, color="#f4a62a", alpha=0.4)
-    if lang == "de":
-        ax.set_title("Preisentwicklung vs. Kaufmenge")
-        ax.set_xlabel("Monat")
-        ax.set_ylabel("BTC Menge", color="#f4a62a")
-    else:
-        ax.set_title("Price vs. purchase volume")
-        ax.set_xlabel("Month")
-        ax.set_ylabel("BTC amount", color="#f4a62a")
+    ax.set_title(t["chart_price_volume"])
+    ax.set_xlabel(t["chart_month"])
+    ax.set_ylabel(t["chart_btc_amount"], color="#f4a62a")
     ax.tick_params(axis="x", rotation=45)
     ax2 = ax.twinx()
     ax2.plot(month_labels, avg_price_vals, marker="o", color="blue", linewidth=2)
-    ax2.set_ylabel("Preis (EUR)" if lang == "de" else "Price (EUR)", color="blue")
+    ax2.set_ylabel(t["chart_price"].format(cur=cur), color="blue")
     ax.grid(True, axis="y", alpha=0.3)
 
+    if rolling:
+        windows = rolling_windows(purchases)
+
+        ax = axs[2, 0]
+        ax.scatter(
+            [r["dt"] for r in purchases if r.get("price") is not None],
+            [float(r["price"]) for r in purchases if r.get("price") is not None],
+            color="grey",
+            s=10,
+            alpha=0.5,
+        )
+        for key, points in windows.items():
+            ax.plot([p.dt for p in points], [float(p.avg_price) for p in points], linewidth=2, label=t[f"window_{key}"])
+        ax.set_title(t["chart_rolling_price"].format(cur=cur))
+        ax.set_ylabel(t["chart_price"].format(cur=cur))
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis="x", rotation=45)
+
+        ax = axs[2, 1]
+        for key, points in windows.items():
+            ax.plot([p.dt for p in points], [float(p.drawdown) for p in points], linewidth=2, label=t[f"window_{key}"])
+        ax.set_title(t["chart_drawdown"])
+        ax.set_ylabel(t["chart_drawdown_pct"])
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis="x", rotation=45)
+
     fig.tight_layout()
     fig.savefig(output_path, dpi=150)
 
@@ -109,6 +127,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("input", help="Input CSV/TXT export file")
     parser.add_argument("output", nargs="?", default=None, help="Output PNG path")
     parser.add_argument("--chart", action="store_true", help="Generate charts")
+    parser.add_argument("--currency", default=None, help="Reporting currency (default: account currency)")
+    parser.add_argument("--fx-file", default=None, help="Local daily FX rates CSV (Date,Base,Quote,Rate)")
+    parser.add_argument("--rolling", action="store_true", help="Add rolling-window charts")
     parser.add_argument("--de", action="store_true", help="German chart labels")
     return parser.parse_args()
 
@@ -129,5 +150,15 @@ def cli_main() -> None:
     output_path = report_dir / out_name
 
     lang = "de" if args.de else "en"
-    generate_charts(input_path, output_path, lang=lang)
+    currency = args.currency.upper() if args.currency else None
+    try:
+        fx = FxTable.load(args.fx_file) if args.fx_file else None
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Cannot load FX file: {exc}")
+    rows = load_rows(input_path)
+    try:
+        normalize_rows(rows, currency or default_currency(rows), fx)
+    except ValueError as exc:
+        raise SystemExit(f"Currency conversion failed: {exc}")
+    generate_charts(rows, output_path, lang=lang, rolling=args.rolling)
     print(f"Wrote {output_path}")
@@ -3,29 +3,70 @@ from __future__ import annotations
 import argparse
 from decimal import Decimal
 from pathlib import Path
+from typing import List
 
-from .analysis import analyze
+from .analysis import PartialAggregate, analyze
+from .cache import MANIFEST_NAME, Manifest, file_digest, fingerprint
 from .charts import generate_charts
+from .fx import FxTable, default_currency, normalize_rows
+from .i18n import STRINGS
 from .io import load_rows
-from .report import build_markdown, insert_image_after_h1, run_pandoc
+from .merge import write_aggregate
+from .report import build_markdown_multi, insert_image_after_h1, run_pandoc
+from .rolling import rolling_windows
+from .schemas import UnknownExportFormat
+from .tax import tax_years, write_tax_csv, write_tax_json
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Analyze Strike BTC DCA history.")
     parser.add_argument("input", help="Input CSV/TXT export file")
     parser.add_argument("output", nargs="?", default=None, help="Output markdown filename")
-    parser.add_argument("--current-price-eur", default=None, help="Current BTC price in EUR")
+    parser.add_argument(
+        "--current-price",
+        "--current-price-eur",
+        dest="current_price",
+        default=None,
+        help="Current BTC price in the reporting currency",
+    )
     parser.add_argument("--current-price-date", default=None, help="Date for current BTC price (YYYY-MM-DD)")
-    parser.add_argument("--fx-rate", default=None, help="FX reference: 1 EUR = X USD")
+    parser.add_argument("--fx-rate", default=None, help="FX reference: 1 EUR = X USD (ignored with --fx-file)")
     parser.add_argument("--fx-date", default=None, help="FX reference date (YYYY-MM-DD)")
+    parser.add_argument("--currency", default=None, help="Reporting currency (default: account currency)")
+    parser.add_argument("--fx-file", default=None, help="Local daily FX rates CSV (Date,Base,Quote,Rate)")
     parser.add_argument("--no-charts", action="store_true", help="Skip chart generation")
     parser.add_argument("--no-pdf", action="store_true", help="Skip PDF generation")
     parser.add_argument("--pdf-engine", default=None, help="Pandoc PDF engine (default: xelatex)")
     parser.add_argument("--report-dir", default=None, help="Override Report directory path")
+    parser.add_argument("--rolling", action="store_true", help="Add rolling 4-week/3-month/12-month statistics")
+    parser.add_argument(
+        "--tax-pack",
+        action="store_true",
+        help="Add tax-year holding periods to the report and write <input>-tax.csv/.json",
+    )
     parser.add_argument("--de", action="store_true", help="Generate German output")
+    parser.add_argument("--lang", default=None, help="Comma-separated report languages, e.g. en,de (overrides --de)")
+    parser.add_argument(
+        "--aggregate-out",
+        action="store_true",
+        help="Also write a mergeable partial aggregate (<input>-aggregate.json) for strike_merge.py",
+    )
+    parser.add_argument("--force", action="store_true", help="Regenerate outputs even if their inputs are unchanged")
     return parser.parse_args()
 
 
+def load_normalized_rows(input_path: Path, currency: str | None, fx: FxTable | None) -> List[dict]:
+    try:
+        rows = load_rows(input_path)
+    except UnknownExportFormat as exc:
+        raise SystemExit(f"{input_path}: {exc}")
+    try:
+        normalize_rows(rows, currency or default_currency(rows), fx)
+    except ValueError as exc:
+        raise SystemExit(f"Currency conversion failed: {exc}")
+    return rows
+
+
 def main() -> None:
     args = parse_args()
     input_path = Path(args.input)
@@ -33,51 +74,167 @@ def main() -> None:
     report_dir = Path(args.report_dir) if args.report_dir else (input_path.parent / "Report")
     report_dir.mkdir(parents=True, exist_ok=True)
 
-    output_name = Path(args.output).name if args.output else f"{input_path.stem}-analysis.md"
-    output_path = report_dir / output_name
-    chart_path = report_dir / f"{input_path.stem}-charts.png"
-    pdf_path = report_dir / f"{input_path.stem}-analysis.pdf"
-
-    rows = load_rows(input_path)
-    result = analyze(rows)
-
-    lang = "de" if args.de else "en"
-    current_price = Decimal(str(args.current_price_eur)) if args.current_price_eur else None
-
-    markdown = build_markdown(
-        result,
-        current_price_eur=current_price,
-        current_price_date=args.current_price_date,
-        fx_rate=args.fx_rate,
-        fx_date=args.fx_date,
-        lang=lang,
-    )
-    output_path.write_text(markdown, encoding="utf-8")
-
-    if not args.no_charts:
-        try:
-            generate_charts(input_path, chart_path, lang=lang)
-        except Exception as exc:
-            print(f"Chart generation failed: {exc}")
-
-    if not args.no_pdf:
-        if chart_path.exists():
-            combined_md = report_dir / f"{input_path.stem}-combined.md"
-            combined_md.write_text(
-                insert_image_after_h1(output_path.read_text(), chart_path.name),
-                encoding="utf-8",
-            )
-            ok, msg = run_pandoc(combined_md, pdf_path, engine=args.pdf_engine)
-            if not ok:
-                print(f"PDF generation failed: {msg}")
-        else:
-            print("PDF generation skipped: chart image not found.")
-
-    print(f"Wrote {output_path}")
-    if chart_path.exists():
-        print(f"Wrote {chart_path}")
-    if pdf_path.exists():
-        print(f"Wrote {pdf_path}")
+    if args.lang:
+        langs = list(dict.fromkeys(lang.strip() for lang in args.lang.split(",") if lang.strip()))
+    else:
+        langs = ["de" if args.de else "en"]
+    unknown = [lang for lang in langs if lang not in STRINGS]
+    if unknown:
+        raise SystemExit(f"Unknown report language: {', '.join(unknown)} (available: {', '.join(sorted(STRINGS))})")
+    # With several languages every output gets a -<lang> suffix.
+    suffixes = {lang: (f"-{lang}" if len(langs) > 1 else "") for lang in langs}
+
+    output_name = Path(args.output) if args.output else Path(f"{input_path.stem}-analysis.md")
+    output_paths = {lang: report_dir / f"{output_name.stem}{sfx}{output_name.suffix}" for lang, sfx in suffixes.items()}
+    chart_paths = {lang: report_dir / f"{input_path.stem}-charts{sfx}.png" for lang, sfx in suffixes.items()}
+    combined_paths = {lang: report_dir / f"{input_path.stem}-combined{sfx}.md" for lang, sfx in suffixes.items()}
+    pdf_paths = {lang: report_dir / f"{input_path.stem}-analysis{sfx}.pdf" for lang, sfx in suffixes.items()}
+
+    current_price = Decimal(str(args.current_price)) if args.current_price else None
+    currency = args.currency.upper() if args.currency else None
+    fx_rate, fx_date = args.fx_rate, args.fx_date
+    if args.fx_file and fx_rate:
+        # The EUR/USD note would not describe the pairs the FX file converted.
+        print("--fx-rate is ignored with --fx-file")
+        fx_rate = fx_date = None
+
+    manifest = Manifest(report_dir / MANIFEST_NAME)
+    if args.force:
+        manifest.entries.clear()
+    try:
+        fx = FxTable.load(args.fx_file) if args.fx_file else None
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Cannot load FX file: {exc}")
+    data = {
+        "data": file_digest(input_path),
+        "fx_file": file_digest(args.fx_file) if args.fx_file else None,
+        "currency": currency,
+        "rolling": args.rolling,
+    }
+
+    md_fps = {
+        lang: fingerprint(
+            stage="analysis.md",
+            lang=lang,
+            current_price=current_price,
+            current_price_date=args.current_price_date,
+            fx_rate=fx_rate,
+            fx_date=fx_date,
+            tax=args.tax_pack,
+            **data,
+        )
+        for lang in langs
+    }
+    stale = [lang for lang in langs if not manifest.is_fresh(output_paths[lang], md_fps[lang])]
+    rows = None
+    tax = None
+    if stale:
+        rows = load_normalized_rows(input_path, currency, fx)
+        result = analyze(rows)
+        if args.tax_pack:
+            tax = tax_years(rows, account=input_path.stem)
+
+        markdowns = build_markdown_multi(
+            result,
+            stale,
+            current_price=current_price,
+            current_price_date=args.current_price_date,
+            fx_rate=fx_rate,
+            fx_date=fx_date,
+            rolling=rolling_windows(result.real_purchases) if args.rolling else None,
+            tax=tax,
+        )
+        for lang, markdown in markdowns.items():
+            output_paths[lang].write_text(markdown, encoding="utf-8")
+            manifest.record(output_paths[lang], md_fps[lang])
+        manifest.save()
+
+    if args.aggregate_out:
+        aggregate_path = report_dir / f"{input_path.stem}-aggregate.json"
+        aggregate_fp = fingerprint(stage="aggregate.json", data=data["data"], fx_file=data["fx_file"], currency=currency)
+        if not manifest.is_fresh(aggregate_path, aggregate_fp):
+            if rows is None:
+                rows = load_normalized_rows(input_path, currency, fx)
+            write_aggregate(PartialAggregate.from_rows(rows), aggregate_path)
+            manifest.record(aggregate_path, aggregate_fp)
+            manifest.save()
+
+    if args.tax_pack:
+        tax_csv = report_dir / f"{input_path.stem}-tax.csv"
+        tax_json = report_dir / f"{input_path.stem}-tax.json"
+        tax_fp = fingerprint(stage="tax", data=data["data"], fx_file=data["fx_file"], currency=currency)
+        if not (manifest.is_fresh(tax_csv, tax_fp) and manifest.is_fresh(tax_json, tax_fp)):
+            if tax is None:
+                if rows is None:
+                    rows = load_normalized_rows(input_path, currency, fx)
+                tax = tax_years(rows, account=input_path.stem)
+            write_tax_csv(tax, tax_csv)
+            write_tax_json(tax, tax_json)
+            manifest.record(tax_csv, tax_fp)
+            manifest.record(tax_json, tax_fp)
+            manifest.save()
+
+    for lang in langs:
+        output_path = output_paths[lang]
+        chart_path = chart_paths[lang]
+        pdf_path = pdf_paths[lang]
+
+        if not args.no_charts:
+            chart_fp = fingerprint(stage="charts.png", lang=lang, **data)
+            if not manifest.is_fresh(chart_path, chart_fp):
+                if rows is None:
+                    rows = load_normalized_rows(input_path, currency, fx)
+                try:
+                    generate_charts(rows, chart_path, lang=lang, rolling=args.rolling)
+                except Exception as exc:
+                    print(f"Chart generation failed: {exc}")
+                else:
+                    manifest.record(chart_path, chart_fp)
+                    manifest.save()
+
+        if not args.no_pdf:
+            if chart_path.exists():
+                combined_md = combined_paths[lang]
+                combined_fp = fingerprint(
+                    stage="combined.md",
+                    analysis=file_digest(output_path),
+                    charts=file_digest(chart_path),
+                )
+                if not manifest.is_fresh(combined_md, combined_fp):
+                    combined_md.write_text(
+                        insert_image_after_h1(output_path.read_text(), chart_path.name),
+                        encoding="utf-8",
+                    )
+                    manifest.record(combined_md, combined_fp)
+                    manifest.save()
+                pdf_fp = fingerprint(
+                    stage="analysis.pdf",
+                    combined=file_digest(combined_md),
+                    charts=file_digest(chart_path),
+                    engine=args.pdf_engine,
+                )
+                if not manifest.is_fresh(pdf_path, pdf_fp):
+                    ok, msg = run_pandoc(combined_md, pdf_path, engine=args.pdf_engine)
+                    if ok:
+                        manifest.record(pdf_path, pdf_fp)
+                        manifest.save()
+                    else:
+                        print(f"PDF generation failed: {msg}")
+            else:
+                print("PDF generation skipped: chart image not found.")
+
+    for lang in langs:
+        print(f"Wrote {output_paths[lang]}")
+    if args.aggregate_out:
+        print(f"Wrote {aggregate_path}")
+    if args.tax_pack:
+        print(f"Wrote {tax_csv}")
+        print(f"Wrote {tax_json}")
+    for lang in langs:
+        if chart_paths[lang].exists():
+            print(f"Wrote {chart_paths[lang]}")
+        if pdf_paths[lang].exists():
+            print(f"Wrote {pdf_paths[lang]}")
 
 
 if __name__ == "__main__":
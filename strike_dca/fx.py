@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import csv
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .io import Row, row_currencies
+
+
+# Local daily FX file, one rate per line:
+#   Date,Base,Quote,Rate
+#   2025-01-02,EUR,USD,1.0353
+# meaning 1 Base = Rate Quote on that day. Missing days (weekends, holidays)
+# fall back to the nearest previous date.
+FX_HEADERS = ("Date", "Base", "Quote", "Rate")
+
+
+class FxSeries:
+    """Daily rates for one currency pair, indexed by date ordinal."""
+
+    def __init__(self, points: Iterable[Tuple[date, Decimal]]) -> None:
+        ordered = sorted(points)
+        self.days: List[int] = [d.toordinal() for d, _ in ordered]
+        self.rates: List[Decimal] = [r for _, r in ordered]
+
+    def lookup(self, days: List[date]) -> List[Decimal]:
+        """Nearest-previous rate for each of ``days`` (which must be sorted)."""
+        out: List[Decimal] = []
+        lo = 0
+        for d in days:
+            idx = bisect_right(self.days, d.toordinal(), lo) - 1
+            if idx < 0:
+                first = date.fromordinal(self.days[0]) if self.days else None
+                raise ValueError(f"No FX rate on or before {d} (first rate: {first})")
+            out.append(self.rates[idx])
+            lo = idx
+        return out
+
+
+class FxTable:
+    def __init__(self, series: Dict[Tuple[str, str], FxSeries]) -> None:
+        self.series = series
+
+    @classmethod
+    def load(cls, path: Path | str) -> "FxTable":
+        path = Path(path)
+        points: Dict[Tuple[str, str], List[Tuple[date, Decimal]]] = defaultdict(list)
+        with path.open(newline="") as f:
+            reader = csv.DictReader(f)
+            missing = [h for h in FX_HEADERS if h not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"{path}: missing FX columns: {', '.join(missing)}")
+            for line, r in enumerate(reader, start=2):
+                try:
+                    pair = (r["Base"].strip().upper(), r["Quote"].strip().upper())
+                    points[pair].append((date.fromisoformat(r["Date"].strip()), Decimal(r["Rate"].strip())))
+                except (AttributeError, ValueError, ArithmeticError):
+                    raise ValueError(f"{path}:{line}: malformed FX row") from None
+        return cls({pair: FxSeries(p) for pair, p in points.items()})
+
+    def rates(self, source: str, target: str, days: List[date]) -> List[Decimal]:
+        """Rates converting 1 ``source`` into ``target`` for sorted ``days``."""
+        if source == target:
+            return [Decimal("1")] * len(days)
+        if (source, target) in self.series:
+            return self.series[(source, target)].lookup(days)
+        if (target, source) in self.series:
+            return [Decimal("1") / r for r in self.series[(target, source)].lookup(days)]
+        for base, quote in self.series:
+            if quote == source and (base, target) in self.series:
+                to_source = self.series[(base, source)].lookup(days)
+                to_target = self.series[(base, target)].lookup(days)
+                return [t / s for s, t in zip(to_source, to_target)]
+        raise ValueError(f"No FX rates to convert {source} to {target}")
+
+
+def default_currency(rows: List[Row]) -> str:
+    """The account currency if all rows share one, else EUR."""
+    currencies = row_currencies(rows)
+    return currencies.pop() if len(currencies) == 1 else "EUR"
+
+
+FIAT_FIELDS = ("amount_fiat", "fee_fiat", "cost_basis", "price")
+
+
+def normalize_rows(rows: List[Row], currency: str, fx: FxTable | None = None) -> List[Row]:
+    """Convert every fiat leg into ``currency`` in place.
+
+    Rows are batched per source currency so each currency needs a single
+    sorted sweep over the FX index.
+    """
+    by_currency: Dict[str, List[Row]] = defaultdict(list)
+    for r in rows:
+        cur = r.get("currency")
+        if cur and cur != currency:
+            if r.get("dt") is not None:
+                by_currency[cur].append(r)
+            continue
+        r["currency"] = currency
+
+    for cur, group in by_currency.items():
+        if fx is None:
+            raise ValueError(f"{len(group)} rows are in {cur}; an FX file is required to report in {currency}")
+        days = sorted({r["dt"].date() for r in group})
+        rate_by_day = dict(zip(days, fx.rates(cur, currency, days)))
+        for r in group:
+            rate = rate_by_day[r["dt"].date()]
+            for key in FIAT_FIELDS:
+                if r.get(key) is not None:
+                    r[key] = r[key] * rate
+            r["source_currency"] = cur
+            r["fx_rate"] = rate
+            r["currency"] = currency
+    return rows
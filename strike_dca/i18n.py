@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+# Report and chart string tables. Placeholders are filled with str.format from
+# values that were formatted once, independently of the language. To add a
+# language, add a table here (missing keys fall back to English) and its month
+# names.
+
+STRINGS: Dict[str, Dict[str, str]] = {
+    "en": {
+        "title": "# Strike {title_year} DCA Analysis (Real Purchases)",
+        "period_year": "In {year}",
+        "period_range": "In {start}–{end}",
+        "period_unknown": "In the analysis period",
+        "summary_h": "## Executive Summary",
+        "summary": (
+            "{period} {total_btc} BTC were purchased for {total_fiat} {cur}; "
+            "the weighted average entry price is {avg_price} {cur}/BTC."
+        ),
+        "quarterly": "Quarterly average buy price ({cur}/BTC): {parts}.",
+        "above": "above",
+        "below": "below",
+        "as_of": " (as of {date}{fx_note})",
+        "current": (
+            "At a current BTC price of {price} {cur}{as_of}, the market price is "
+            "about {delta}% {direction} the average entry; unrealized P/L is "
+            "{pnl} {cur} ({pnl_pct}) based on purchased BTC."
+        ),
+        "definitions_h": "## Definitions",
+        "def_real": "- **Real purchases**: `Transaction Type = Purchase/Trade` **and** `Amount BTC` present.",
+        "def_cost": "- **Cost basis**: if empty, derived from the fiat amount ({cur}) or `Amount BTC * BTC Price`.",
+        "def_non_exec": "- **Non-executed purchases**: Purchase rows without BTC amount (e.g., initiated/cancelled target orders).",
+        "overview_h": "## Overview",
+        "period": "- Period: {start} to {end}",
+        "real_purchases": "- Real purchases: {count}",
+        "purchase_days": "- Purchase days: {days} (days with >1 purchase: {multi}, max/day: {max})",
+        "btc_purchased": "- BTC purchased: {total_btc}",
+        "invested": "- Invested ({cur}, cost basis): {total_fiat}",
+        "avg_entry": "- Average entry price: {avg_price} {cur}/BTC",
+        "fees_h": "## Fees",
+        "fees_fiat": "- Total {cur} fees: {fees}",
+        "fees_btc": "- Total BTC fees: {fees}",
+        "monthly_h": "## Monthly Overview (Real Purchases)",
+        "monthly_header": "| Month | {cur} Spent | BTC Bought | Avg Price ({cur}/BTC) | Min Price | Max Price | # Purchases |",
+        "rolling_h": "## Rolling Windows (Real Purchases)",
+        "rolling_note": (
+            "Trailing windows ending at the last purchase; drawdown is the cheapest purchase vs. the window's average entry."
+        ),
+        "rolling_header": (
+            "| Window | # Purchases | {cur} Spent | BTC Bought | Avg Price ({cur}/BTC) | Min Price | Max Price | "
+            "Price Std. Dev. | Drawdown |"
+        ),
+        "window_4w": "4 weeks",
+        "window_3m": "3 months",
+        "window_12m": "12 months",
+        "chart_month": "Month",
+        "chart_price": "Price ({cur})",
+        "chart_avg_price": "Average purchase price per Bitcoin ({cur})",
+        "chart_btc_bought": "Bitcoin bought per month",
+        "chart_btc_amount": "BTC amount",
+        "chart_fiat_spent": "{cur} spent per month",
+        "chart_fiat_amount": "{cur} amount",
+        "chart_price_volume": "Price vs. purchase volume",
+        "chart_rolling_price": "Rolling average purchase price ({cur})",
+        "chart_drawdown": "Drawdown of cheapest purchase vs. average entry",
+        "chart_drawdown_pct": "Drawdown (%)",
+        "tax_h": "## Tax Years (Holding Periods, FIFO)",
+        "tax_note": (
+            "Disposals are BTC sends/withdrawals; long = held more than 365 days "
+            "(at disposal, or at December 31 for holdings)."
+        ),
+        "tax_header": (
+            "| Year | # Purchases | BTC Acquired | {cur} Invested | BTC Disposed | Disposed >1y | "
+            "Held >1y | Held ≤1y | Cost Held ≤1y ({cur}) |"
+        ),
+        "other_h": "## Other Transaction Types",
+        "deposits": "- Deposits: {count} (Total {cur}: {total})",
+        "withdrawals": "- Withdrawals: {count} (Total {cur}: {total})",
+        "sends": "- Sends: {count} (Net BTC: {total}; excluding reversals: {excl})",
+        "send_reversals": "- Send reversals: {count}",
+        "non_exec_h": "## Non-Executed Purchase Events",
+        "non_exec_count": "- Count: {count}",
+        "non_exec_sum": "- Sum Amount {cur} (signed): {total}",
+        "non_exec_breakdown": "- Breakdown by description:",
+        "empty": "(empty)",
+        "inferred_h": "## Purchases With Derived Cost Basis",
+        "inferred_header": "| Date (UTC) | BTC | Price | Cost Basis | Source | Description |",
+        "checks_h": "## Data Quality / Checks",
+        "checks_no_btc": "- Purchase rows without BTC amount: {count}",
+        "checks_inferred": "- Purchase rows with derived cost basis: {count}",
+        "deposit_dist_h": "## Deposit Distribution",
+        "deposit_dist_header": "| {cur} Amount | Count |",
+    },
+    "de": {
+        "title": "# Strike {title_year} DCA Analyse (Reale Käufe)",
+        "period_year": "Im Jahr {year}",
+        "period_range": "Im Zeitraum {start}–{end}",
+        "period_unknown": "Im Analysezeitraum",
+        "summary_h": "## Zusammenfassung",
+        "summary": (
+            "{period} wurden {total_btc} BTC für {total_fiat} {cur} gekauft; "
+            "der gewichtete Ø Einstand liegt bei {avg_price} {cur}/BTC."
+        ),
+        "quarterly": "Quartals-Ø Kaufpreis ({cur}/BTC): {parts}.",
+        "above": "über",
+        "below": "unter",
+        "as_of": " (Stand: {date}{fx_note})",
+        "current": (
+            "Bei einem aktuellen BTC-Preis von {price} {cur}{as_of} liegt der Marktpreis "
+            "ca. {delta}% {direction} dem Ø Einstand; unrealisiert entspricht das "
+            "{pnl} {cur} ({pnl_pct}) auf Basis der gekauften BTC."
+        ),
+        "definitions_h": "## Definitionen",
+        "def_real": "- **Reale Käufe**: `Transaction Type = Purchase/Trade` **und** `Amount BTC` vorhanden.",
+        "def_cost": "- **Cost Basis**: falls leer, wird sie aus dem Fiat-Betrag ({cur}) oder `Amount BTC * BTC Price` abgeleitet.",
+        "def_non_exec": "- **Nicht-executed Käufe**: Purchase-Zeilen ohne BTC-Menge (z. B. Initiated/Cancelled Target Orders).",
+        "overview_h": "## Überblick",
+        "period": "- Zeitraum: {start} bis {end}",
+        "real_purchases": "- Reale Käufe: {count}",
+        "purchase_days": "- Kauftage: {days} (Tage mit >1 Kauf: {multi}, max/Tag: {max})",
+        "btc_purchased": "- Gekaufte BTC: {total_btc}",
+        "invested": "- Investiert ({cur}, Cost Basis): {total_fiat}",
+        "avg_entry": "- Ø Kaufpreis: {avg_price} {cur}/BTC",
+        "fees_h": "## Gebühren",
+        "fees_fiat": "- {cur}-Fees gesamt: {fees}",
+        "fees_btc": "- BTC-Fees gesamt: {fees}",
+        "monthly_h": "## Monatsübersicht (Reale Käufe)",
+        "monthly_header": "| Monat | Käufe {cur} | Käufe BTC | Ø Preis ({cur}/BTC) | Min Preis | Max Preis | Anzahl Käufe |",
+        "rolling_h": "## Rollierende Zeitfenster (Reale Käufe)",
+        "rolling_note": "Zeitfenster bis zum letzten Kauf; Drawdown ist der günstigste Kauf relativ zum Ø Einstand des Fensters.",
+        "rolling_header": (
+            "| Fenster | Anzahl Käufe | Käufe {cur} | Käufe BTC | Ø Preis ({cur}/BTC) | Min Preis | Max Preis | "
+            "Preis-Std.-Abw. | Drawdown |"
+        ),
+        "window_4w": "4 Wochen",
+        "window_3m": "3 Monate",
+        "window_12m": "12 Monate",
+        "chart_month": "Monat",
+        "chart_price": "Preis ({cur})",
+        "chart_avg_price": "Durchschnittlicher Kaufpreis pro Bitcoin ({cur})",
+        "chart_btc_bought": "Bitcoin gekauft pro Monat",
+        "chart_btc_amount": "BTC Menge",
+        "chart_fiat_spent": "{cur} ausgegeben pro Monat",
+        "chart_fiat_amount": "{cur} Betrag",
+        "chart_price_volume": "Preisentwicklung vs. Kaufmenge",
+        "chart_rolling_price": "Rollierender Ø Kaufpreis ({cur})",
+        "chart_drawdown": "Drawdown günstigster Kauf vs. Ø Einstand",
+        "chart_drawdown_pct": "Drawdown (%)",
+        "tax_h": "## Steuerjahre (Haltefristen, FIFO)",
+        "tax_note": (
+            "Abgänge sind BTC-Sends/Withdrawals; >1J = länger als 365 Tage gehalten "
+            "(beim Abgang bzw. zum 31.12. für Bestände)."
+        ),
+        "tax_header": (
+            "| Jahr | Anzahl Käufe | BTC erworben | Investiert {cur} | BTC Abgänge | Abgänge >1J | "
+            "Bestand >1J | Bestand ≤1J | Kosten Bestand ≤1J ({cur}) |"
+        ),
+        "other_h": "## Andere Transaktionstypen",
+        "deposits": "- Deposits: {count} (Summe {cur}: {total})",
+        "withdrawals": "- Withdrawals: {count} (Summe {cur}: {total})",
+        "sends": "- Sends: {count} (Netto BTC: {total}; ohne Reversals: {excl})",
+        "send_reversals": "- Send-Reversals: {count}",
+        "non_exec_h": "## Nicht-executed Purchase-Events",
+        "non_exec_count": "- Anzahl: {count}",
+        "non_exec_sum": "- Summe Amount {cur} (inkl. Vorzeichen): {total}",
+        "non_exec_breakdown": "- Aufschlüsselung nach Description:",
+        "empty": "(leer)",
+        "inferred_h": "## Käufe mit abgeleiteter Cost Basis",
+        "inferred_header": "| Datum (UTC) | BTC | Preis | Cost Basis | Quelle | Beschreibung |",
+        "checks_h": "## Datenqualität / Checks",
+        "checks_no_btc": "- Purchase-Zeilen ohne BTC-Menge: {count}",
+        "checks_inferred": "- Purchase-Zeilen mit fehlender Cost Basis (abgeleitet): {count}",
+        "deposit_dist_h": "## Deposit-Verteilung",
+        "deposit_dist_header": "| Betrag {cur} | Anzahl |",
+    },
+}
+
+MONTH_ABBR: Dict[str, Tuple[str, ...]] = {
+    "en": ("Jan.", "Feb.", "Mar.", "Apr.", "May.", "Jun.", "Jul.", "Aug.", "Sep.", "Oct.", "Nov.", "Dec."),
+    "de": ("Jan.", "Feb.", "Mrz.", "Apr.", "Mai", "Jun.", "Jul.", "Aug.", "Sep.", "Okt.", "Nov.", "Dez."),
+}
+
+
+def strings(lang: str) -> Dict[str, str]:
+    if lang == "en" or lang not in STRINGS:
+        return STRINGS["en"]
+    return {**STRINGS["en"], **STRINGS[lang]}
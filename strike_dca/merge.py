@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Tuple
+
+from .analysis import PartialAggregate, merge_aggregates
+from .fx import FxTable, default_currency, normalize_rows
+from .io import load_rows
+from .report import build_markdown
+from .tax import TaxLedger, TaxYear, total_by_year, write_tax_csv, write_tax_json
+
+
+def process_file(
+    path: Path | str,
+    currency: str | None = None,
+    fx_file: str | None = None,
+    tax: bool = False,
+) -> Tuple[PartialAggregate, TaxLedger | None]:
+    """Aggregate (and optionally FIFO ledger) of one export or saved ``*-aggregate.json``.
+
+    Saved aggregates carry no purchase lots, so they never yield a ledger.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        return PartialAggregate.from_dict(json.loads(path.read_text(encoding="utf-8"))), None
+    rows = load_rows(path)
+    fx = FxTable.load(fx_file) if fx_file else None
+    normalize_rows(rows, currency or default_currency(rows), fx)
+    return PartialAggregate.from_rows(rows), (TaxLedger(rows, account=path.stem) if tax else None)
+
+
+def write_aggregate(aggregate: PartialAggregate, path: Path | str) -> None:
+    Path(path).write_text(json.dumps(aggregate.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Consolidate several Strike accounts into one report.")
+    parser.add_argument("inputs", nargs="+", help="Export files and/or saved *-aggregate.json partials")
+    parser.add_argument("--output", default="consolidated-analysis.md", help="Output markdown filename")
+    parser.add_argument("--report-dir", default=None, help="Override Report directory path")
+    parser.add_argument("--currency", default=None, help="Reporting currency (default: account currency)")
+    parser.add_argument("--fx-file", default=None, help="Local daily FX rates CSV (Date,Base,Quote,Rate)")
+    parser.add_argument("--current-price", default=None, help="Current BTC price in the reporting currency")
+    parser.add_argument("--current-price-date", default=None, help="Date for current BTC price (YYYY-MM-DD)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--aggregate-out",
+        action="store_true",
+        help="Also write the merged partial aggregate (consolidated-aggregate.json)",
+    )
+    parser.add_argument(
+        "--tax-pack",
+        action="store_true",
+        help="Add tax-year holding periods and write consolidated-tax.csv/.json (export inputs only)",
+    )
+    parser.add_argument("--de", action="store_true", help="Generate German output")
+    return parser.parse_args()
+
+
+def cli_main() -> None:
+    args = parse_args()
+    inputs = [Path(p) for p in args.inputs]
+    currency = args.currency.upper() if args.currency else None
+    partials = [p for p in inputs if p.suffix == ".json"]
+    if args.tax_pack and partials:
+        # Totals would include these accounts while the tax section could not.
+        raise SystemExit(
+            f"--tax-pack needs purchase lots, which saved aggregates lack: {', '.join(map(str, partials))}"
+        )
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(process_file, p, currency, args.fx_file, args.tax_pack) for p in inputs]
+        try:
+            processed = [f.result() for f in futures]
+        except (OSError, ValueError) as exc:
+            raise SystemExit(str(exc))
+    parts: List[PartialAggregate] = [agg for agg, _ in processed]
+    ledgers = [ledger for _, ledger in processed if ledger is not None]
+    # Render every account through the same last year so the yearly totals
+    # include holdings of accounts that have gone quiet.
+    through_year = max((ledger.last_year for ledger in ledgers if ledger.last_year), default=None)
+    tax: List[TaxYear] = [ty for ledger in ledgers for ty in ledger.years(through_year)]
+    try:
+        merged = merge_aggregates(parts)
+    except ValueError as exc:
+        raise SystemExit(f"{exc} (pass --currency and --fx-file)")
+
+    exports = [p for p in inputs if p not in partials]
+    if args.report_dir:
+        report_dir = Path(args.report_dir)
+    else:
+        # Saved partials already live in a Report directory.
+        report_dir = exports[0].parent / "Report" if exports else inputs[0].parent
+    report_dir.mkdir(parents=True, exist_ok=True)
+    output_path = report_dir / Path(args.output).name
+
+    markdown = build_markdown(
+        merged.to_result(),
+        current_price=Decimal(str(args.current_price)) if args.current_price else None,
+        current_price_date=args.current_price_date,
+        lang="de" if args.de else "en",
+        tax=total_by_year(tax) if args.tax_pack else None,
+    )
+    output_path.write_text(markdown, encoding="utf-8")
+    print(f"Wrote {output_path}")
+    stem = Path(args.output).stem.replace("-analysis", "")
+    if args.tax_pack:
+        write_tax_csv(tax, report_dir / f"{stem}-tax.csv")
+        write_tax_json(tax, report_dir / f"{stem}-tax.json")
+        print(f"Wrote {report_dir / f'{stem}-tax.csv'}")
+        print(f"Wrote {report_dir / f'{stem}-tax.json'}")
+    if args.aggregate_out:
+        write_aggregate(merged, report_dir / f"{stem}-aggregate.json")
+        print(f"Wrote {report_dir / f'{stem}-aggregate.json'}")
@@ -3,237 +3,353 @@ from __future__ import annotations
 import shutil
 import subprocess
 from decimal import Decimal
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
 
 from .analysis import AnalysisResult
+from .i18n import strings
+from .rolling import RollingPoint
+from .tax import TaxYear
 from .utils import btc, fmt_dt, money, month_abbr, percent, q2
 
 
-def build_markdown(
+@dataclass
+class ReportData:
+    """Report content with every number formatted once, for any language."""
+
+    values: Dict[str, Any]
+    start_year: int | None
+    end_year: int | None
+    has_period: bool
+    quarter_parts: List[str]
+    current: Dict[str, Any] | None
+    monthly_rows: List[Tuple[int, str]]
+    rolling_rows: List[Tuple[str, str]]
+    tax_rows: List[str]
+    show_send_reversals: bool
+    non_exec_by_desc: List[Tuple[str, int]]
+    inferred_rows: List[str]
+    deposit_rows: List[str]
+
+
+def prepare_report(
     result: AnalysisResult,
-    current_price_eur: Decimal | None = None,
+    current_price: Decimal | None = None,
     current_price_date: str | None = None,
     fx_rate: str | None = None,
     fx_date: str | None = None,
-    lang: str = "en",
-) -> str:
-    start_year = result.start_date.year if result.start_date else None
-    end_year = result.end_date.year if result.end_date else None
-
-    if start_year and end_year:
-        if start_year == end_year:
-            period_label = f"In {start_year}" if lang == "en" else f"Im Jahr {start_year}"
-        else:
-            period_label = (
-                f"In {start_year}–{end_year}" if lang == "en" else f"Im Zeitraum {start_year}–{end_year}"
-            )
-    else:
-        period_label = "In the analysis period" if lang == "en" else "Im Analysezeitraum"
+    rolling: Dict[str, List[RollingPoint]] | None = None,
+    tax: List[TaxYear] | None = None,
+) -> ReportData:
+    values: Dict[str, Any] = {
+        "cur": result.currency,
+        "total_btc": btc(result.total_btc),
+        "total_fiat": money(result.total_fiat),
+        "avg_price": money(result.avg_price),
+        "start": result.start_date,
+        "end": result.end_date,
+        "real_purchases": result.real_purchase_count,
+        "purchase_days": result.purchase_days,
+        "multi_purchase_days": result.multi_purchase_days,
+        "max_per_day": result.max_per_day,
+        "fee_fiat": money(result.fee_fiat_total),
+        "fee_btc": btc(result.fee_btc_total),
+        "deposit_count": result.deposit_count,
+        "deposit_total": money(result.deposit_total),
+        "withdrawal_count": result.withdrawal_count,
+        "withdrawal_total": money(result.withdrawal_total),
+        "send_count": result.send_count,
+        "send_total": btc(result.send_total_btc),
+        "send_excl": btc(result.send_total_btc_excl_rev),
+        "send_reversal_count": result.send_reversal_count,
+        "non_exec_count": result.non_executed_count,
+        "non_exec_total": money(result.non_exec_amount_fiat),
+        "inferred_count": result.inferred_count,
+    }
 
-    lines: list[str] = []
-    title_year = f"{start_year}" if start_year == end_year and start_year else "Analysis"
-    if start_year and end_year and start_year != end_year:
-        title_year = f"{start_year}-{end_year}"
-
-    lines.append(
-        f"# Strike {title_year} DCA Analysis (Real Purchases)"
-        if lang == "en"
-        else f"# Strike {title_year} DCA Analyse (Reale Käufe)"
-    )
-    lines.append("")
-
-    lines.append("## Executive Summary" if lang == "en" else "## Zusammenfassung")
-    lines.append(
-        f"{period_label} {btc(result.total_btc)} BTC were purchased for {money(result.total_eur)} EUR; "
-        f"the weighted average entry price is {money(result.avg_price)} EUR/BTC."
-        if lang == "en"
-        else f"{period_label} wurden {btc(result.total_btc)} BTC für {money(result.total_eur)} EUR gekauft; "
-        f"der gewichtete Ø Einstand liegt bei {money(result.avg_price)} EUR/BTC."
-    )
-
-    quarter_parts: list[str] = []
+    quarter_parts: List[str] = []
     for q_key in sorted(result.quarterly.keys()):
-        q_eur = result.quarterly[q_key]["eur"]
+        q_fiat = result.quarterly[q_key]["fiat"]
         q_btc = result.quarterly[q_key]["btc"]
-        q_avg = (q_eur / q_btc) if q_btc else Decimal("0")
+        q_avg = (q_fiat / q_btc) if q_btc else Decimal("0")
         quarter_parts.append(f"{q_key}: {money(q_avg)}")
-    if quarter_parts:
-        prefix = "Quarterly average buy price (EUR/BTC): " if lang == "en" else "Quartals-Ø Kaufpreis (EUR/BTC): "
-        lines.append(prefix + "; ".join(quarter_parts) + ".")
-
-    if current_price_eur is not None:
-        delta = ((current_price_eur - result.avg_price) / result.avg_price) * Decimal("100")
-        current_value = current_price_eur * result.total_btc
-        pnl = current_value - result.total_eur
-        pnl_pct = (pnl / result.total_eur) * Decimal("100") if result.total_eur else Decimal("0")
-        direction = "above" if delta >= 0 else "below"
-        direction_de = "über" if delta >= 0 else "unter"
-        fx_note = f"; FX {fx_date}: 1 EUR = {fx_rate} USD" if fx_rate and fx_date else ""
-        date_note = f" (as of {current_price_date}{fx_note})" if current_price_date else ""
-        date_note_de = f" (Stand: {current_price_date}{fx_note})" if current_price_date else ""
-        lines.append(
-            f"At a current BTC price of {money(current_price_eur)} EUR{date_note}, the market price is "
-            f"about {q2(abs(delta))}% {direction} the average entry; unrealized P/L is "
-            f"{money(pnl)} EUR ({percent(pnl_pct)}) based on purchased BTC."
-            if lang == "en"
-            else f"Bei einem aktuellen BTC-Preis von {money(current_price_eur)} EUR{date_note_de} liegt der Marktpreis "
-            f"ca. {q2(abs(delta))}% {direction_de} dem Ø Einstand; unrealisiert entspricht das "
-            f"{money(pnl)} EUR ({percent(pnl_pct)}) auf Basis der gekauften BTC."
-        )
-
-    lines.append("")
-
-    lines.append("## Definitions" if lang == "en" else "## Definitionen")
-    if lang == "en":
-        lines.append("- **Real purchases**: `Transaction Type = Purchase/Trade` **and** `Amount BTC` present.")
-        lines.append("- **Cost basis**: if empty, derived from `Amount EUR` or `Amount BTC * BTC Price`.")
-        lines.append("- **Non-executed purchases**: Purchase rows without BTC amount (e.g., initiated/cancelled target orders).")
-    else:
-        lines.append("- **Reale Käufe**: `Transaction Type = Purchase/Trade` **und** `Amount BTC` vorhanden.")
-        lines.append("- **Cost Basis**: falls leer, wird sie aus `Amount EUR` oder `Amount BTC * BTC Price` abgeleitet.")
-        lines.append("- **Nicht-executed Käufe**: Purchase-Zeilen ohne BTC-Menge (z. B. Initiated/Cancelled Target Orders).")
-    lines.append("")
-
-    lines.append("## Overview" if lang == "en" else "## Überblick")
-    if result.start_date and result.end_date:
-        lines.append(
-            f"- Period: {result.start_date} to {result.end_date}"
-            if lang == "en"
-            else f"- Zeitraum: {result.start_date} bis {result.end_date}"
-        )
-    lines.append(f"- Real purchases: {len(result.real_purchases)}" if lang == "en" else f"- Reale Käufe: {len(result.real_purchases)}")
-    lines.append(
-        f"- Purchase days: {result.purchase_days} (days with >1 purchase: {result.multi_purchase_days}, max/day: {result.max_per_day})"
-        if lang == "en"
-        else f"- Kauftage: {result.purchase_days} (Tage mit >1 Kauf: {result.multi_purchase_days}, max/Tag: {result.max_per_day})"
-    )
-    lines.append(f"- BTC purchased: {btc(result.total_btc)}" if lang == "en" else f"- Gekaufte BTC: {btc(result.total_btc)}")
-    lines.append(
-        f"- Invested (EUR, cost basis): {money(result.total_eur)}"
-        if lang == "en"
-        else f"- Investiert (EUR, Cost Basis): {money(result.total_eur)}"
-    )
-    lines.append(
-        f"- Average entry price: {money(result.avg_price)} EUR/BTC"
-        if lang == "en"
-        else f"- Ø Kaufpreis: {money(result.avg_price)} EUR/BTC"
-    )
-    lines.append("")
 
-    lines.append("## Fees" if lang == "en" else "## Gebühren")
-    lines.append(
-        f"- Total EUR fees: {money(result.fee_eur_total)}"
-        if lang == "en"
-        else f"- EUR-Fees gesamt: {money(result.fee_eur_total)}"
-    )
-    lines.append(
-        f"- Total BTC fees: {btc(result.fee_btc_total)}"
-        if lang == "en"
-        else f"- BTC-Fees gesamt: {btc(result.fee_btc_total)}"
-    )
-    lines.append("")
+    current = None
+    if current_price is not None:
+        delta = ((current_price - result.avg_price) / result.avg_price) * Decimal("100")
+        current_value = current_price * result.total_btc
+        pnl = current_value - result.total_fiat
+        pnl_pct = (pnl / result.total_fiat) * Decimal("100") if result.total_fiat else Decimal("0")
+        current = {
+            "price": money(current_price),
+            "delta": q2(abs(delta)),
+            "above": delta >= 0,
+            "pnl": money(pnl),
+            "pnl_pct": percent(pnl_pct),
+            "date": current_price_date,
+            "fx_note": f"; FX {fx_date}: 1 EUR = {fx_rate} USD" if fx_rate and fx_date else "",
+        }
 
-    lines.append("## Monthly Overview (Real Purchases)" if lang == "en" else "## Monatsübersicht (Reale Käufe)")
-    lines.append(
-        "| Month | EUR Spent | BTC Bought | Avg Price (EUR/BTC) | Min Price | Max Price | # Purchases |"
-        if lang == "en"
-        else "| Monat | Käufe EUR | Käufe BTC | Ø Preis (EUR/BTC) | Min Preis | Max Preis | Anzahl Käufe |"
-    )
-    lines.append("|---|---:|---:|---:|---:|---:|---:|")
+    monthly_rows: List[Tuple[int, str]] = []
     for m in sorted(result.monthly.keys()):
-        month_num = int(m.split("-")[1])
-        month_label = month_abbr(month_num, lang=lang)
-        eur = result.monthly[m]["eur"]
+        fiat = result.monthly[m]["fiat"]
         btc_amt = result.monthly[m]["btc"]
         cnt = result.monthly[m]["count"]
-        avg = (eur / btc_amt) if btc_amt else Decimal("0")
+        avg = (fiat / btc_amt) if btc_amt else Decimal("0")
         min_p = result.monthly[m]["min_price"]
         max_p = result.monthly[m]["max_price"]
         min_p_s = money(min_p) if min_p is not None else ""
         max_p_s = money(max_p) if max_p is not None else ""
-        lines.append(
-            f"| {month_label} | {money(eur)} | {btc(btc_amt)} | {money(avg)} | {min_p_s} | {max_p_s} | {cnt} |"
+        monthly_rows.append(
+            (int(m.split("-")[1]), f"{money(fiat)} | {btc(btc_amt)} | {money(avg)} | {min_p_s} | {max_p_s} | {cnt} |")
         )
-    lines.append("")
 
-    lines.append("## Other Transaction Types" if lang == "en" else "## Andere Transaktionstypen")
-    lines.append(
-        f"- Deposits: {len(result.deposits)} (Total EUR: {money(result.deposit_total)})"
-        if lang == "en"
-        else f"- Deposits: {len(result.deposits)} (Summe EUR: {money(result.deposit_total)})"
-    )
-    lines.append(
-        f"- Withdrawals: {len(result.withdrawals)} (Total EUR: {money(result.withdrawal_total)})"
-        if lang == "en"
-        else f"- Withdrawals: {len(result.withdrawals)} (Summe EUR: {money(result.withdrawal_total)})"
-    )
-    lines.append(
-        f"- Sends: {len(result.sends)} (Net BTC: {btc(result.send_total_btc)}; excluding reversals: {btc(result.send_total_btc_excl_rev)})"
-        if lang == "en"
-        else f"- Sends: {len(result.sends)} (Netto BTC: {btc(result.send_total_btc)}; ohne Reversals: {btc(result.send_total_btc_excl_rev)})"
-    )
-    if result.send_reversals:
-        lines.append(
-            f"- Send reversals: {len(result.send_reversals)}"
-            if lang == "en"
-            else f"- Send-Reversals: {len(result.send_reversals)}"
+    rolling_rows: List[Tuple[str, str]] = []
+    for key, points in (rolling or {}).items():
+        if not points:
+            continue
+        p = points[-1]
+        min_p_s = money(p.min_price) if p.min_price is not None else ""
+        max_p_s = money(p.max_price) if p.max_price is not None else ""
+        rolling_rows.append(
+            (
+                key,
+                f"{p.count} | {money(p.fiat)} | {btc(p.btc)} | {money(p.avg_price)} | "
+                f"{min_p_s} | {max_p_s} | {money(p.dispersion)} | {percent(p.drawdown)} |",
+            )
         )
-    lines.append("")
-
-    lines.append("## Non-Executed Purchase Events" if lang == "en" else "## Nicht-executed Purchase-Events")
-    lines.append(f"- Count: {len(result.non_executed)}" if lang == "en" else f"- Anzahl: {len(result.non_executed)}")
-    lines.append(
-        f"- Sum Amount EUR (signed): {money(result.non_exec_amount_eur)}"
-        if lang == "en"
-        else f"- Summe Amount EUR (inkl. Vorzeichen): {money(result.non_exec_amount_eur)}"
-    )
-    if result.non_exec_by_desc:
-        lines.append("- Breakdown by description:" if lang == "en" else "- Aufschlüsselung nach Description:")
-        for desc, cnt in result.non_exec_by_desc.items():
-            label = desc if desc else ("(empty)" if lang == "en" else "(leer)")
-            lines.append(f"  - {label}: {cnt}")
-    lines.append("")
-
-    if result.inferred_rows:
-        lines.append(
-            "## Purchases With Derived Cost Basis" if lang == "en" else "## Käufe mit abgeleiteter Cost Basis"
+
+    tax_rows = [
+        f"| {ty.year} | {ty.acquisitions} | {btc(ty.acquired_btc)} | {money(ty.acquired_cost)} | "
+        f"{btc(ty.disposed_btc)} | {btc(ty.disposed_long_btc)} | {btc(ty.held_long_btc)} | "
+        f"{btc(ty.held_short_btc)} | {money(ty.held_short_cost)} |"
+        for ty in tax or []
+    ]
+
+    inferred_rows: List[str] = []
+    for row, cost, source in result.inferred_rows:
+        price = row.get("price") or Decimal("0")
+        desc = (row.get("Description") or "").strip()
+        inferred_rows.append(
+            f"| {fmt_dt(row.get('dt'))} | {btc(row.get('amount_btc') or Decimal('0'))} | "
+            f"{money(price)} | {money(cost)} | {source} | {desc} |"
         )
-        lines.append(
-            "| Date (UTC) | BTC | Price | Cost Basis | Source | Description |"
-            if lang == "en"
-            else "| Datum (UTC) | BTC | Preis | Cost Basis | Quelle | Beschreibung |"
+
+    return ReportData(
+        values=values,
+        start_year=result.start_date.year if result.start_date else None,
+        end_year=result.end_date.year if result.end_date else None,
+        has_period=bool(result.start_date and result.end_date),
+        quarter_parts=quarter_parts,
+        current=current,
+        monthly_rows=monthly_rows,
+        rolling_rows=rolling_rows,
+        tax_rows=tax_rows,
+        show_send_reversals=bool(result.send_reversal_count),
+        non_exec_by_desc=list(result.non_exec_by_desc.items()),
+        inferred_rows=inferred_rows,
+        deposit_rows=[f"| {amt:.0f} | {cnt} |" for amt, cnt in sorted(result.deposit_counts.items())],
+    )
+
+
+class _Writer:
+    """Appends each report line to every requested language at once."""
+
+    def __init__(self, langs: List[str]) -> None:
+        self.tables = {lang: strings(lang) for lang in langs}
+        self.lines: Dict[str, List[str]] = {lang: [] for lang in langs}
+
+    def text(self, key: str, **values: Any) -> None:
+        for lang, t in self.tables.items():
+            self.lines[lang].append(t[key].format(**values))
+
+    def raw(self, line: str) -> None:
+        for lines in self.lines.values():
+            lines.append(line)
+
+    def each(self, render: Callable[[str, Dict[str, str]], str]) -> None:
+        for lang, t in self.tables.items():
+            self.lines[lang].append(render(lang, t))
+
+
+def render_markdown(data: ReportData, langs: List[str]) -> Dict[str, str]:
+    """Render ``data`` into every language of ``langs`` in a single pass."""
+    v = data.values
+    cur = v["cur"]
+    w = _Writer(langs)
+    start_year, end_year = data.start_year, data.end_year
+
+    def period_label(t: Dict[str, str]) -> str:
+        if start_year and end_year:
+            if start_year == end_year:
+                return t["period_year"].format(year=start_year)
+            return t["period_range"].format(start=start_year, end=end_year)
+        return t["period_unknown"]
+
+    title_year = f"{start_year}" if start_year == end_year and start_year else "Analysis"
+    if start_year and end_year and start_year != end_year:
+        title_year = f"{start_year}-{end_year}"
+
+    w.text("title", title_year=title_year)
+    w.raw("")
+
+    w.text("summary_h")
+    w.each(
+        lambda lang, t: t["summary"].format(
+            period=period_label(t), total_btc=v["total_btc"], total_fiat=v["total_fiat"], avg_price=v["avg_price"], cur=cur
         )
-        lines.append("|---|---:|---:|---:|---|---|")
-        for row, cost, source in result.inferred_rows:
-            price = row.get("price") or Decimal("0")
-            desc = (row.get("Description") or "").strip()
-            lines.append(
-                f"| {fmt_dt(row.get('dt'))} | {btc(row.get('amount_btc') or Decimal('0'))} | "
-                f"{money(price)} | {money(cost)} | {source} | {desc} |"
+    )
+    if data.quarter_parts:
+        w.text("quarterly", cur=cur, parts="; ".join(data.quarter_parts))
+    c = data.current
+    if c is not None:
+        w.each(
+            lambda lang, t: t["current"].format(
+                price=c["price"],
+                cur=cur,
+                as_of=t["as_of"].format(date=c["date"], fx_note=c["fx_note"]) if c["date"] else "",
+                delta=c["delta"],
+                direction=t["above"] if c["above"] else t["below"],
+                pnl=c["pnl"],
+                pnl_pct=c["pnl_pct"],
             )
-        lines.append("")
+        )
+    w.raw("")
 
-    lines.append("## Data Quality / Checks" if lang == "en" else "## Datenqualität / Checks")
-    lines.append(
-        f"- Purchase rows without BTC amount: {len(result.non_executed)}"
-        if lang == "en"
-        else f"- Purchase-Zeilen ohne BTC-Menge: {len(result.non_executed)}"
-    )
-    lines.append(
-        f"- Purchase rows with derived cost basis: {len(result.inferred_rows)}"
-        if lang == "en"
-        else f"- Purchase-Zeilen mit fehlender Cost Basis (abgeleitet): {len(result.inferred_rows)}"
+    w.text("definitions_h")
+    w.text("def_real")
+    w.text("def_cost", cur=cur)
+    w.text("def_non_exec")
+    w.raw("")
+
+    w.text("overview_h")
+    if data.has_period:
+        w.text("period", start=v["start"], end=v["end"])
+    w.text("real_purchases", count=v["real_purchases"])
+    w.text("purchase_days", days=v["purchase_days"], multi=v["multi_purchase_days"], max=v["max_per_day"])
+    w.text("btc_purchased", total_btc=v["total_btc"])
+    w.text("invested", cur=cur, total_fiat=v["total_fiat"])
+    w.text("avg_entry", cur=cur, avg_price=v["avg_price"])
+    w.raw("")
+
+    w.text("fees_h")
+    w.text("fees_fiat", cur=cur, fees=v["fee_fiat"])
+    w.text("fees_btc", fees=v["fee_btc"])
+    w.raw("")
+
+    w.text("monthly_h")
+    w.text("monthly_header", cur=cur)
+    w.raw("|---|---:|---:|---:|---:|---:|---:|")
+    for month_num, cells in data.monthly_rows:
+        w.each(lambda lang, t: f"| {month_abbr(month_num, lang=lang)} | {cells}")
+    w.raw("")
+
+    if data.rolling_rows:
+        w.text("rolling_h")
+        w.text("rolling_note")
+        w.raw("")
+        w.text("rolling_header", cur=cur)
+        w.raw("|---|---:|---:|---:|---:|---:|---:|---:|---:|")
+        for key, cells in data.rolling_rows:
+            w.each(lambda lang, t: f"| {t.get(f'window_{key}', key)} | {cells}")
+        w.raw("")
+
+    if data.tax_rows:
+        w.text("tax_h")
+        w.text("tax_note")
+        w.raw("")
+        w.text("tax_header", cur=cur)
+        w.raw("|---|---:|---:|---:|---:|---:|---:|---:|---:|")
+        for line in data.tax_rows:
+            w.raw(line)
+        w.raw("")
+
+    w.text("other_h")
+    w.text("deposits", count=v["deposit_count"], cur=cur, total=v["deposit_total"])
+    w.text("withdrawals", count=v["withdrawal_count"], cur=cur, total=v["withdrawal_total"])
+    w.text("sends", count=v["send_count"], total=v["send_total"], excl=v["send_excl"])
+    if data.show_send_reversals:
+        w.text("send_reversals", count=v["send_reversal_count"])
+    w.raw("")
+
+    w.text("non_exec_h")
+    w.text("non_exec_count", count=v["non_exec_count"])
+    w.text("non_exec_sum", cur=cur, total=v["non_exec_total"])
+    if data.non_exec_by_desc:
+        w.text("non_exec_breakdown")
+        for desc, cnt in data.non_exec_by_desc:
+            if desc:
+                w.raw(f"  - {desc}: {cnt}")
+            else:
+                w.each(lambda lang, t: f"  - {t['empty']}: {cnt}")
+    w.raw("")
+
+    if data.inferred_rows:
+        w.text("inferred_h")
+        w.text("inferred_header")
+        w.raw("|---|---:|---:|---:|---|---|")
+        for line in data.inferred_rows:
+            w.raw(line)
+        w.raw("")
+
+    w.text("checks_h")
+    w.text("checks_no_btc", count=v["non_exec_count"])
+    w.text("checks_inferred", count=v["inferred_count"])
+    w.raw("")
+
+    w.text("deposit_dist_h")
+    w.text("deposit_dist_header", cur=cur)
+    w.raw("|---:|---:|")
+    for line in data.deposit_rows:
+        w.raw(line)
+    w.raw("")
+
+    return {lang: "\n".join(lines) for lang, lines in w.lines.items()}
+
+
+def build_markdown_multi(
+    result: AnalysisResult,
+    langs: List[str],
+    current_price: Decimal | None = None,
+    current_price_date: str | None = None,
+    fx_rate: str | None = None,
+    fx_date: str | None = None,
+    rolling: Dict[str, List[RollingPoint]] | None = None,
+    tax: List[TaxYear] | None = None,
+) -> Dict[str, str]:
+    data = prepare_report(
+        result,
+        current_price=current_price,
+        current_price_date=current_price_date,
+        fx_rate=fx_rate,
+        fx_date=fx_date,
+        rolling=rolling,
+        tax=tax,
     )
-    lines.append("")
+    return render_markdown(data, langs)
 
-    lines.append("## Deposit Distribution" if lang == "en" else "## Deposit-Verteilung")
-    lines.append("| EUR Amount | Count |" if lang == "en" else "| Betrag EUR | Anzahl |")
-    lines.append("|---:|---:|")
-    for amt, cnt in sorted(result.deposit_counts.items()):
-        lines.append(f"| {amt:.0f} | {cnt} |")
-    lines.append("")
 
-    return "\n".join(lines)
+def build_markdown(
+    result: AnalysisResult,
+    current_price: Decimal | None = None,
+    current_price_date: str | None = None,
+    fx_rate: str | None = None,
+    fx_date: str | None = None,
+    lang: str = "en",
+    rolling: Dict[str, List[RollingPoint]] | None = None,
+    tax: List[TaxYear] | None = None,
+) -> str:
+    return build_markdown_multi(
+        result,
+        [lang],
+        current_price=current_price,
+        current_price_date=current_price_date,
+        fx_rate=fx_rate,
+        fx_date=fx_date,
+        rolling=rolling,
+        tax=tax,
+    )[lang]
 
 
 def insert_image_after_h1(md_text: str, image_name: str) -> str:
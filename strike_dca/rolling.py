@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Deque, Dict, List
+
+from .io import Row, infer_cost_basis
+from .utils import q2
+
+
+WINDOWS: Dict[str, timedelta] = {
+    "4w": timedelta(weeks=4),
+    "3m": timedelta(days=91),
+    "12m": timedelta(days=365),
+}
+
+
+@dataclass
+class RollingPoint:
+    dt: datetime
+    count: int
+    fiat: Decimal
+    btc: Decimal
+    avg_price: Decimal
+    min_price: Decimal | None
+    max_price: Decimal | None
+    dispersion: Decimal
+    drawdown: Decimal
+
+
+def rolling_stats(purchases: List[Row], window: timedelta) -> List[RollingPoint]:
+    """Trailing-window statistics ending at each purchase.
+
+    ``purchases`` must be sorted by ``dt`` (as ``AnalysisResult.real_purchases``
+    is). The window is advanced with two pointers and running sums; min/max
+    prices come from monotonic deques, so the cost is linear in the number of
+    purchases whatever the window size.
+
+    ``dispersion`` is the population standard deviation of purchase prices and
+    ``drawdown`` the cheapest purchase price relative to the weighted average
+    entry, in percent rounded to 0.01.
+    """
+    if window <= timedelta(0):
+        raise ValueError(f"rolling window must be positive, got {window}")
+    costs = [infer_cost_basis(r)[0] for r in purchases]
+    points: List[RollingPoint] = []
+    fiat = btc = price_sum = price_sq = Decimal("0")
+    priced = 0
+    mins: Deque[int] = deque()
+    maxs: Deque[int] = deque()
+    left = 0
+
+    for right, r in enumerate(purchases):
+        fiat += costs[right]
+        btc += r.get("amount_btc") or Decimal("0")
+        price = r.get("price")
+        if price is not None:
+            price_sum += price
+            price_sq += price * price
+            priced += 1
+            while mins and purchases[mins[-1]]["price"] >= price:
+                mins.pop()
+            mins.append(right)
+            while maxs and purchases[maxs[-1]]["price"] <= price:
+                maxs.pop()
+            maxs.append(right)
+
+        start = r["dt"] - window
+        while purchases[left]["dt"] <= start:
+            old = purchases[left]
+            fiat -= costs[left]
+            btc -= old.get("amount_btc") or Decimal("0")
+            if old.get("price") is not None:
+                price_sum -= old["price"]
+                price_sq -= old["price"] * old["price"]
+                priced -= 1
+            left += 1
+        while mins and mins[0] < left:
+            mins.popleft()
+        while maxs and maxs[0] < left:
+            maxs.popleft()
+
+        avg_price = (fiat / btc) if btc else Decimal("0")
+        min_price = purchases[mins[0]]["price"] if mins else None
+        max_price = purchases[maxs[0]]["price"] if maxs else None
+        if priced:
+            mean = price_sum / priced
+            variance = max(price_sq / priced - mean * mean, Decimal("0"))
+            dispersion = variance.sqrt()
+        else:
+            dispersion = Decimal("0")
+        if avg_price and min_price is not None:
+            drawdown = q2((min_price - avg_price) / avg_price * Decimal("100"))
+            if not drawdown:
+                # Drop the sign of conversion residue so it never shows as -0.00%.
+                drawdown = Decimal("0")
+        else:
+            drawdown = Decimal("0")
+
+        points.append(
+            RollingPoint(
+                dt=r["dt"],
+                count=right - left + 1,
+                fiat=fiat,
+                btc=btc,
+                avg_price=avg_price,
+                min_price=min_price,
+                max_price=max_price,
+                dispersion=dispersion,
+                drawdown=drawdown,
+            )
+        )
+    return points
+
+
+def rolling_windows(
+    purchases: List[Row],
+    windows: Dict[str, timedelta] | None = None,
+) -> Dict[str, List[RollingPoint]]:
+    windows = WINDOWS if windows is None else windows
+    return {key: rolling_stats(purchases, span) for key, span in windows.items()}
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from .utils import dec, parse_dt, parse_dt_parts
+
+
+Row = Dict[str, Any]
+Converter = Callable[[Sequence[str]], Row]
+
+# Raw columns kept on every row for downstream code (type checks, reversal
+# detection, reporting); all other raw columns are dropped at load time.
+PASSTHROUGH = ("Reference", "Transaction Type", "Description")
+
+
+class UnknownExportFormat(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ExportSchema:
+    """A Strike export layout.
+
+    ``required`` identifies the layout from its header row; ``compile`` turns
+    that header into a converter working on positional ``csv.reader`` rows.
+    """
+
+    name: str
+    required: Tuple[str, ...]
+    compile: Callable[[List[str]], Converter]
+
+    def matches(self, headers: List[str]) -> bool:
+        return all(h in headers for h in self.required)
+
+
+SCHEMAS: List[ExportSchema] = []
+
+
+def register_schema(name: str, required: Tuple[str, ...]) -> Callable[[Callable[[List[str]], Converter]], Callable[[List[str]], Converter]]:
+    """Register a layout; schemas are tried in registration order."""
+
+    def decorator(compile_fn: Callable[[List[str]], Converter]) -> Callable[[List[str]], Converter]:
+        SCHEMAS.append(ExportSchema(name=name, required=required, compile=compile_fn))
+        return compile_fn
+
+    return decorator
+
+
+def detect_schema(headers: List[str]) -> ExportSchema:
+    for schema in SCHEMAS:
+        if schema.matches(headers):
+            return schema
+    known = "; ".join(f"{s.name} ({', '.join(s.required)})" for s in SCHEMAS)
+    raise UnknownExportFormat(
+        f"Unknown Strike export layout with columns: {', '.join(headers) or '(none)'}. Known layouts: {known}"
+    )
+
+
+def _index(headers: List[str]) -> Dict[str, int]:
+    return {h.strip(): i for i, h in enumerate(headers)}
+
+
+def _passthrough(idx: Dict[str, int]) -> List[Tuple[str, int]]:
+    return [(name, idx[name]) for name in PASSTHROUGH if name in idx]
+
+
+def _legacy_currency(headers: List[str]) -> str | None:
+    for h in headers:
+        if h.startswith("Amount ") and h != "Amount BTC":
+            return h[len("Amount "):].strip()
+    return None
+
+
+@register_schema("legacy", ("Date & Time (UTC)", "Transaction Type", "Amount BTC"))
+def compile_legacy(headers: List[str]) -> Converter:
+    idx = _index(headers)
+    cur = _legacy_currency(headers)
+    keep = _passthrough(idx)
+    i_dt = idx["Date & Time (UTC)"]
+    i_type = idx["Transaction Type"]
+    i_amount = idx.get(f"Amount {cur}")
+    i_fee = idx.get(f"Fee {cur}")
+    i_btc = idx["Amount BTC"]
+    i_fee_btc = idx.get("Fee BTC")
+    i_price = idx.get("BTC Price")
+    i_cost = idx.get(f"Cost Basis ({cur})")
+
+    def convert(t: Sequence[str]) -> Row:
+        r: Row = {name: t[i] for name, i in keep}
+        r["dt"] = parse_dt(t[i_dt])
+        r["currency"] = cur
+        r["amount_fiat"] = dec(t[i_amount]) if i_amount is not None else None
+        r["fee_fiat"] = dec(t[i_fee]) if i_fee is not None else None
+        r["amount_btc"] = dec(t[i_btc])
+        r["fee_btc"] = dec(t[i_fee_btc]) if i_fee_btc is not None else None
+        r["price"] = dec(t[i_price]) if i_price is not None else None
+        r["cost_basis"] = dec(t[i_cost]) if i_cost is not None else None
+        r["raw_type"] = t[i_type]
+        return r
+
+    return convert
+
+
+@register_schema("annual", ("Transaction Type", "Amount 1", "Currency 1", "Amount 2", "Currency 2"))
+def compile_annual(headers: List[str]) -> Converter:
+    idx = _index(headers)
+    keep = _passthrough(idx)
+    i_done_date = idx.get("Completed Date (UTC)")
+    i_done_time = idx.get("Completed Time (UTC)")
+    i_init_date = idx.get("Initiated Date (UTC)")
+    i_init_time = idx.get("Initiated Time (UTC)")
+    i_type = idx["Transaction Type"]
+    i_amount1 = idx["Amount 1"]
+    i_amount2 = idx["Amount 2"]
+    i_cur1 = idx["Currency 1"]
+    i_cur2 = idx["Currency 2"]
+    i_fee1 = idx.get("Fee 1")
+    i_fee2 = idx.get("Fee 2")
+    i_price = idx.get("BTC Price")
+
+    def convert(t: Sequence[str]) -> Row:
+        r: Row = {name: t[i] for name, i in keep}
+        dt = parse_dt_parts(
+            t[i_done_date] if i_done_date is not None else None,
+            t[i_done_time] if i_done_time is not None else None,
+        )
+        if dt is None:
+            dt = parse_dt_parts(
+                t[i_init_date] if i_init_date is not None else None,
+                t[i_init_time] if i_init_time is not None else None,
+            )
+        r["dt"] = dt
+
+        c1 = t[i_cur1].strip()
+        c2 = t[i_cur2].strip()
+        fiat1 = bool(c1) and c1 != "BTC"
+        fiat2 = bool(c2) and c2 != "BTC"
+        btc1 = c1 == "BTC"
+        btc2 = c2 == "BTC"
+
+        # Only the legs that are actually used get converted.
+        fiat_amount = fiat_fee = btc_amount = btc_fee = None
+        if fiat1:
+            fiat_amount = dec(t[i_amount1])
+            fiat_fee = dec(t[i_fee1]) if i_fee1 is not None else None
+        elif fiat2:
+            fiat_amount = dec(t[i_amount2])
+            fiat_fee = dec(t[i_fee2]) if i_fee2 is not None else None
+        if btc1:
+            btc_amount = dec(t[i_amount1])
+            btc_fee = dec(t[i_fee1]) if i_fee1 is not None else None
+        elif btc2:
+            btc_amount = dec(t[i_amount2])
+            btc_fee = dec(t[i_fee2]) if i_fee2 is not None else None
+
+        r["currency"] = c1 if fiat1 else c2 if fiat2 else None
+        r["amount_fiat"] = fiat_amount
+        r["fee_fiat"] = fiat_fee
+        r["amount_btc"] = btc_amount
+        r["fee_btc"] = btc_fee
+        r["price"] = dec(t[i_price]) if i_price is not None else None
+        r["cost_basis"] = abs(fiat_amount) if fiat_amount is not None else None
+        r["raw_type"] = t[i_type]
+        return r
+
+    return convert
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import csv
+import json
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import asdict, dataclass, fields
+from datetime import date
+from decimal import Decimal
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .io import Row, infer_cost_basis, is_purchase_type
+from .utils import q2, q8
+
+
+HOLDING_DAYS = 365
+DISPOSAL_TYPES = {"send", "withdrawal"}
+
+
+@dataclass
+class TaxYear:
+    """One account's acquisitions, disposals and year-end holdings (FIFO).
+
+    ``long`` means held for more than 365 days: at disposal for the
+    ``disposed_*`` columns, at December 31 for the ``held_*`` columns.
+    ``unmatched_btc`` is BTC sent out beyond the recorded purchases; it does
+    not consume later purchases, so cumulatively ``held_btc`` equals
+    acquired - disposed + unmatched + returned (a reversal of unmatched BTC
+    cancels it and shows as negative ``unmatched_btc``).
+    """
+
+    account: str
+    year: int
+    acquisitions: int
+    acquired_btc: Decimal
+    acquired_cost: Decimal
+    disposals: int
+    disposed_btc: Decimal
+    disposed_long_btc: Decimal
+    disposed_short_btc: Decimal
+    returned_btc: Decimal
+    unmatched_btc: Decimal
+    held_btc: Decimal
+    held_long_btc: Decimal
+    held_long_cost: Decimal
+    held_short_btc: Decimal
+    held_short_cost: Decimal
+
+
+class _LotIndex:
+    """Purchases sorted by day with cumulative BTC and cost for FIFO lookups."""
+
+    def __init__(self, lots: List[Tuple[int, Decimal, Decimal]]) -> None:
+        lots.sort(key=lambda lot: lot[0])
+        self.days = [day for day, _, _ in lots]
+        self.btc = [amount for _, amount, _ in lots]
+        self.cost = [cost for _, _, cost in lots]
+        self.cum_btc = list(accumulate(self.btc, initial=Decimal("0")))
+        self.cum_cost = list(accumulate(self.cost, initial=Decimal("0")))
+
+    def acquired_before(self, day: int) -> Decimal:
+        """BTC bought strictly before ``day``."""
+        return self.cum_btc[bisect_left(self.days, day)]
+
+    def acquired_through(self, day: int) -> Decimal:
+        """BTC bought on or before ``day``."""
+        return self.cum_btc[bisect_right(self.days, day)]
+
+    def fifo_cost(self, amount: Decimal) -> Decimal:
+        """Cost basis of the first ``amount`` BTC in purchase order."""
+        i = bisect_right(self.cum_btc, amount) - 1
+        if i >= len(self.btc):
+            return self.cum_cost[-1]
+        return self.cum_cost[i] + (amount - self.cum_btc[i]) / self.btc[i] * self.cost[i]
+
+
+def _disposal_amount(row: Row) -> Decimal | None:
+    t = (row.get("Transaction Type") or row.get("raw_type") or "").lower()
+    amount = row.get("amount_btc")
+    if t not in DISPOSAL_TYPES or not amount:
+        return None
+    if amount < 0:
+        return -amount + (row.get("fee_btc") or Decimal("0"))
+    # Positive BTC on a send is a reversal returning coins to the account.
+    return -amount
+
+
+class TaxLedger:
+    """One account's FIFO state, built once and rendered for any year span.
+
+    Holdings keep ageing after the last BTC movement, so the span runs through
+    the account's last dated row, or a later ``through_year`` when several
+    accounts are consolidated.
+    """
+
+    def __init__(self, rows: List[Row], account: str = "") -> None:
+        rows = [r for r in rows if r.get("dt") is not None]
+        self.account = account
+        self.lots = _LotIndex([
+            (r["dt"].date().toordinal(), r["amount_btc"], infer_cost_basis(r)[0])
+            for r in rows
+            if is_purchase_type(r) and r.get("amount_btc") is not None and r["amount_btc"] > 0
+        ])
+        disposals: List[Tuple[int, Decimal]] = []
+        for r in rows:
+            amount = _disposal_amount(r)
+            if amount is not None:
+                disposals.append((r["dt"].date().toordinal(), amount))
+        disposals.sort(key=lambda d: d[0])
+        self.disp_days = [day for day, _ in disposals]
+
+        # FIFO position after each disposal: only BTC matched to earlier purchases
+        # is consumed, and a reversal hands back the most recently consumed BTC.
+        zero = Decimal("0")
+        consumed = zero
+        self.cum_consumed = [zero]
+        per_year: Dict[int, Dict[str, Decimal]] = defaultdict(lambda: defaultdict(Decimal))
+        for day, amount in disposals:
+            bucket = per_year[date.fromordinal(day).year]
+            if amount < 0:
+                restored = min(-amount, consumed)
+                consumed -= restored
+                bucket["returned"] += -amount
+                bucket["unmatched"] -= -amount - restored
+            else:
+                start = consumed
+                consumed = min(start + amount, self.lots.acquired_through(day))
+                long_part = max(min(consumed, self.lots.acquired_before(day - HOLDING_DAYS)) - start, zero)
+                bucket["count"] += 1
+                bucket["disposed"] += amount
+                bucket["long"] += long_part
+                bucket["short"] += consumed - start - long_part
+                bucket["unmatched"] += amount - (consumed - start)
+            self.cum_consumed.append(consumed)
+        # Plain dicts so ledgers can be sent back from worker processes.
+        self.per_year = {year: dict(bucket) for year, bucket in per_year.items()}
+
+        if self.lots.days or self.disp_days:
+            self.first_year: int | None = date.fromordinal(min(self.lots.days[:1] + self.disp_days[:1])).year
+            self.last_year: int | None = max(r["dt"].year for r in rows)
+        else:
+            self.first_year = self.last_year = None
+
+    def years(self, through_year: int | None = None) -> List[TaxYear]:
+        if self.first_year is None or self.last_year is None:
+            return []
+        lots, zero = self.lots, Decimal("0")
+        out: List[TaxYear] = []
+        for year in range(self.first_year, max(self.last_year, through_year or self.last_year) + 1):
+            year_start = date(year, 1, 1).toordinal()
+            year_end = date(year, 12, 31).toordinal()
+            i_start = bisect_left(lots.days, year_start)
+            i_end = bisect_right(lots.days, year_end)
+
+            acquired = lots.cum_btc[i_end]
+            consumed = self.cum_consumed[bisect_right(self.disp_days, year_end)]
+            long_acquired = lots.acquired_before(year_end - HOLDING_DAYS)
+            held_long = max(long_acquired - consumed, zero)
+            held_long_cost = lots.fifo_cost(long_acquired) - lots.fifo_cost(consumed) if held_long else zero
+            held_short_cost = lots.fifo_cost(acquired) - lots.fifo_cost(max(consumed, long_acquired))
+
+            d = self.per_year.get(year, {})
+            out.append(
+                TaxYear(
+                    account=self.account,
+                    year=year,
+                    acquisitions=i_end - i_start,
+                    acquired_btc=lots.cum_btc[i_end] - lots.cum_btc[i_start],
+                    acquired_cost=lots.cum_cost[i_end] - lots.cum_cost[i_start],
+                    disposals=int(d.get("count", 0)),
+                    disposed_btc=d.get("disposed", zero),
+                    disposed_long_btc=d.get("long", zero),
+                    disposed_short_btc=d.get("short", zero),
+                    returned_btc=d.get("returned", zero),
+                    unmatched_btc=d.get("unmatched", zero),
+                    held_btc=acquired - consumed,
+                    held_long_btc=held_long,
+                    held_long_cost=held_long_cost,
+                    held_short_btc=acquired - consumed - held_long,
+                    held_short_cost=held_short_cost,
+                )
+            )
+        _check_reconciles(out)
+        return out
+
+
+def tax_years(rows: List[Row], account: str = "", through_year: int | None = None) -> List[TaxYear]:
+    """Tax-year summaries for one account, from its first BTC movement on."""
+    return TaxLedger(rows, account).years(through_year)
+
+
+def _check_reconciles(years: List[TaxYear]) -> None:
+    """Year-end holdings must follow from the yearly flow columns."""
+    held = Decimal("0")
+    for ty in years:
+        held += ty.acquired_btc - ty.disposed_btc + ty.unmatched_btc + ty.returned_btc
+        if held != ty.held_btc:
+            raise RuntimeError(
+                f"Tax year {ty.year} of {ty.account or 'account'}: holdings {ty.held_btc} "
+                f"do not reconcile with flows {held}"
+            )
+
+
+def total_by_year(years: List[TaxYear]) -> List[TaxYear]:
+    """Sum several accounts' tax years into one row per year.
+
+    Every account must cover the same last year (``TaxLedger.years`` with a
+    shared ``through_year``), or its holdings drop out of the later totals.
+    """
+    totals: Dict[int, TaxYear] = {}
+    for ty in years:
+        if ty.year not in totals:
+            totals[ty.year] = TaxYear(account="", **{f.name: getattr(ty, f.name) for f in fields(TaxYear) if f.name != "account"})
+            continue
+        acc = totals[ty.year]
+        for f in fields(TaxYear):
+            if f.name not in ("account", "year"):
+                setattr(acc, f.name, getattr(acc, f.name) + getattr(ty, f.name))
+    return [totals[y] for y in sorted(totals)]
+
+
+def _export_record(ty: TaxYear) -> Dict[str, Any]:
+    record = asdict(ty)
+    for key, value in record.items():
+        if key.endswith("_btc"):
+            record[key] = f"{q8(value):f}"
+        elif key.endswith("_cost"):
+            record[key] = f"{q2(value):f}"
+    return record
+
+
+def write_tax_csv(years: List[TaxYear], path: Path | str) -> None:
+    with Path(path).open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=[f.name for f in fields(TaxYear)])
+        writer.writeheader()
+        for ty in years:
+            writer.writerow(_export_record(ty))
+
+
+def write_tax_json(years: List[TaxYear], path: Path | str) -> None:
+    payload = [_export_record(ty) for ty in years]
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
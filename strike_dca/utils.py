@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
 
+from .i18n import MONTH_ABBR
+
 DATE_FMT = "%b %d %Y %H:%M:%S"
 DATE_ONLY_FMT = "%b %d %Y"
 
@@ -16,15 +18,26 @@ def dec(value: str | None) -> Decimal | None:
     return Decimal(value)
 
 
+MONTHS = {name: i for i, name in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+)}
+
+
 def parse_dt(value: str) -> datetime:
-    return datetime.strptime(value, DATE_FMT)
+    # Fast path for "Apr 06 2025 10:21:18"; strptime handles anything else.
+    try:
+        mon, day, year, clock = value.split()
+        hh, mm, ss = clock.split(":")
+        return datetime(int(year), MONTHS[mon], int(day), int(hh), int(mm), int(ss))
+    except (KeyError, ValueError):
+        return datetime.strptime(value, DATE_FMT)
 
 
 def parse_dt_parts(date_str: str | None, time_str: str | None) -> datetime | None:
     if not date_str and not time_str:
         return None
     if date_str and time_str:
-        return datetime.strptime(f"{date_str} {time_str}", DATE_FMT)
+        return parse_dt(f"{date_str} {time_str}")
     if date_str:
         return datetime.strptime(date_str, DATE_ONLY_FMT)
     return None
@@ -61,34 +74,5 @@ def btc(value: Decimal) -> str:
 
 
 def month_abbr(month_num: int, lang: str = "en") -> str:
-    if lang == "de":
-        names = {
-            1: "Jan.",
-            2: "Feb.",
-            3: "Mrz.",
-            4: "Apr.",
-            5: "Mai",
-            6: "Jun.",
-            7: "Jul.",
-            8: "Aug.",
-            9: "Sep.",
-            10: "Okt.",
-            11: "Nov.",
-            12: "Dez.",
-        }
-    else:
-        names = {
-            1: "Jan.",
-            2: "Feb.",
-            3: "Mar.",
-            4: "Apr.",
-            5: "May.",
-            6: "Jun.",
-            7: "Jul.",
-            8: "Aug.",
-            9: "Sep.",
-            10: "Oct.",
-            11: "Nov.",
-            12: "Dec.",
-        }
-    return names.get(month_num, "")
+    names = MONTH_ABBR.get(lang, MONTH_ABBR["en"])
+    return names[month_num - 1] if 1 <= month_num <= 12 else ""
@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+from strike_dca.merge import cli_main
+
+
+if __name__ == "__main__":
+    cli_main()